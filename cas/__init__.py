@@ -0,0 +1 @@
+"""Utilidades compartidas del tablero Scaling CAS (datos, redes y render)."""
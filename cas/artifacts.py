@@ -0,0 +1,228 @@
+"""Almacén de artefactos derivados con invalidación por archivo.
+
+Los artefactos (grafos, figuras, payloads, índices...) se guardan por clave y
+se mantienen calientes entre reruns y sesiones. Las dependencias se registran
+solas: los cargadores de ``cas.data`` anuncian el archivo que leen con
+``track`` y un artefacto construido dentro de otro le transmite sus archivos.
+Un hilo vigía revisa cada ``WATCH_INTERVAL`` segundos la versión de los
+archivos registrados y, si uno cambia, descarta y reconstruye solo los
+artefactos que dependen de él; mientras tanto, leer un artefacto es una
+búsqueda en diccionario, sin ``os.stat``. Con ``CAS_WATCH_INTERVAL=0`` no hay
+hilo y cada lectura comprueba las versiones de sus archivos.
+
+Los artefactos precalculados en el despliegue (``cas.precompute``) se
+registran con ``preload`` y se leen de disco la primera vez que se piden, en
+lugar de construirlos.
+"""
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from cas import profiling
+
+logger = logging.getLogger("cas")
+
+WATCH_INTERVAL = float(os.environ.get("CAS_WATCH_INTERVAL", "1.0"))
+MAX_ARTIFACTS = 256
+
+_local = threading.local()
+
+
+def source_version(path):
+    """``(mtime, tamaño)`` de ``path``, o ``None`` si no existe."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _building():
+    # Dependencias de los artefactos en construcción en este hilo (del externo al interno)
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _propagate(deps):
+    for pending in _building():
+        for path, version in deps.items():
+            pending.setdefault(path, version)
+
+
+def key_id(key):
+    """Identificador estable de una clave de artefacto, igual entre procesos."""
+    return repr(key)
+
+
+def track(path, version=None):
+    """Registra ``path`` como dependencia de los artefactos que se están construyendo."""
+    _propagate({path: source_version(path) if version is None else version})
+
+
+class _Artifact:
+    __slots__ = ("value", "deps", "build")
+
+    def __init__(self, value, deps, build):
+        self.value = value
+        self.deps = deps    # ruta -> versión al construir
+        self.build = build  # para reconstruirlo cuando cambie una dependencia
+
+
+class ArtifactStore:
+    def __init__(self, max_artifacts=MAX_ARTIFACTS, interval=WATCH_INTERVAL):
+        self.max_artifacts = max_artifacts
+        self.interval = interval
+        self._entries = OrderedDict()
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._persisted = {}  # key_id -> (archivo, {fuente: versión}), ver ``preload``
+
+    @property
+    def watching(self):
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def get(self, key, build):
+        """Valor del artefacto ``key``; lo construye con ``build()`` si falta o quedó obsoleto."""
+        self._start_watcher()
+        entry = self._lookup(key)
+        event = "hit"
+        if entry is None or not (self.watching or self._fresh(entry)):
+            with self._lock:
+                key_lock = self._locks.setdefault(key, threading.Lock())
+            # Una sola construcción por clave aunque muchas sesiones lo pidan a la vez
+            with key_lock:
+                entry = self._lookup(key)
+                if entry is None or not self._fresh(entry):
+                    entry, event = self._load(key, build), "disk"
+                    if entry is None:
+                        with profiling.stage(f"construir {key[0]}"):
+                            entry, event = self._build(key, build), "miss"
+        profiling.count(key[0], event)
+        _propagate(entry.deps)
+        return entry.value
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def _fresh(entry):
+        return all(source_version(path) == version for path, version in entry.deps.items())
+
+    def _build(self, key, build):
+        deps = {}
+        _building().append(deps)
+        try:
+            value = build()
+        finally:
+            _building().pop()
+        return self._insert(key, _Artifact(value, deps, build))
+
+    def _insert(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_artifacts:
+                old_key, _ = self._entries.popitem(last=False)
+                self._locks.pop(old_key, None)
+        return entry
+
+    def preload(self, artifacts):
+        """Registra artefactos en disco: ``{key_id: (archivo, {fuente: versión})}``.
+
+        Las versiones son las de las fuentes validadas al registrarlos: si una
+        cambia antes de que el artefacto se pida, el artefacto queda obsoleto.
+        """
+        with self._lock:
+            self._persisted.update(artifacts)
+
+    def load_persisted(self, key):
+        """``(valor, dependencias)`` precalculados para ``key``, o ``None``.
+
+        Cada archivo se usa una sola vez: si después cambian los datos, el
+        artefacto se reconstruye en lugar de volver a la versión del despliegue.
+        """
+        with self._lock:
+            item = self._persisted.pop(key_id(key), None)
+        if item is None:
+            return None
+        path, deps = item
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning("No se pudo leer el artefacto precalculado %s: %s", path, e)
+            return None
+        return value, dict(deps)
+
+    def _load(self, key, build):
+        persisted = self.load_persisted(key)
+        if persisted is None:
+            return None
+        value, deps = persisted
+        entry = _Artifact(value, deps, build)
+        # Una fuente editada desde el arranque: se construye con los datos nuevos
+        if not self._fresh(entry):
+            return None
+        return self._insert(key, entry)
+
+    def items(self):
+        """``(clave, valor, archivos de los que depende)`` de los artefactos en memoria."""
+        with self._lock:
+            return [(key, entry.value, list(entry.deps)) for key, entry in self._entries.items()]
+
+    def poll(self):
+        """Descarta y reconstruye los artefactos con archivos modificados; devuelve esas rutas."""
+        with self._lock:
+            entries = list(self._entries.items())
+        current = {path: source_version(path) for _, entry in entries for path in entry.deps}
+        stale = [(key, entry) for key, entry in entries
+                 if any(current[path] != version for path, version in entry.deps.items())]
+        if not stale:
+            return set()
+        changed = {path for _, entry in stale for path, version in entry.deps.items()
+                   if current[path] != version}
+        with self._lock:
+            for key, entry in stale:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+        logger.info("Cambiaron %s: se reconstruyen %d artefactos", ", ".join(sorted(changed)), len(stale))
+        for key, entry in stale:
+            try:
+                self.get(key, entry.build)
+            except Exception:
+                # Se reintentará (y se mostrará el error) en la próxima lectura
+                logger.exception("No se pudo reconstruir el artefacto %r", key)
+        return changed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _start_watcher(self):
+        if self.interval <= 0 or self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name="cas-artifacts", daemon=True)
+                self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Error revisando los archivos de datos")
+
+
+# Almacén compartido por todas las sesiones del proceso
+STORE = ArtifactStore()
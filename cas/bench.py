@@ -0,0 +1,217 @@
+"""Benchmark sin navegador de las rutas calientes de la app.
+
+Mide tiempo y pico de memoria (``tracemalloc``) de cada etapa (índice y
+filtros del inventario, grafo, layout, figura estática, HTML de PyVis,
+payload del componente, centralidades, tabla de interpretación e imágenes del
+carrusel) sobre los datos incluidos y sobre copias sintéticas escaladas de
+las aristas y del inventario. Con ``--app`` también cronometra el primer
+render de cada vista con ``AppTest``::
+
+    python -m cas.bench --scales 1,10,100,1000 --app --json bench.json
+
+Los cachés en disco (layouts y formato columnar) se redirigen a un directorio
+temporal, de modo que cada corrida mide el costo en frío.
+"""
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import networkx as nx
+import pandas as pd
+
+import cas.data
+import cas.layouts
+from cas.data import EDGE_COLUMNS, INVENTORY_CSV, load_inventory, load_network_edges
+from cas.graphs import CompactGraph
+from cas.images import BRIEF_PAGES, encode_image, image_bytes
+from cas.inventory import InventoryIndex
+from cas.layouts import SPRING_PARAMS, spring_layout
+from cas.metrics import DEFAULT_DESCRIPTIONS, centralities, with_key_nodes
+from cas.networks import NETWORKS
+from cas.render import INTERACTIVE_OPTIONS, STATIC_STYLE, graph_payload, pyvis_html, static_figure
+
+# Por encima de este número de nodos no se dibuja (layout, Matplotlib, PyVis)
+MAX_DRAW_NODES = 2000
+# Una etapa que tarda más que esto no se repite
+REPEAT_BUDGET = 1.0
+
+# Primera página de cada pestaña del carrusel
+BRIEF_IMAGES = [pages[0] for pages in BRIEF_PAGES.values()]
+
+
+def bundled_edges():
+    """Aristas de todas las redes registradas, apiladas."""
+    return pd.concat([load_network_edges(spec.edges) for spec in NETWORKS.values()], ignore_index=True)
+
+
+def scale_edges(edges, factor):
+    """``factor`` copias de la red con actores renombrados, unidas en anillo."""
+    if factor == 1:
+        return edges
+    copies = [edges.assign(Origen=edges["Origen"] + f" [{i}]", Destino=edges["Destino"] + f" [{i}]")
+              for i in range(factor)]
+    first = edges["Origen"].iloc[0]
+    ring = pd.DataFrame({"Origen": [f"{first} [{i}]" for i in range(factor)],
+                         "Destino": [f"{first} [{(i + 1) % factor}]" for i in range(factor)],
+                         "Tipo de Interacción": "Enlace", "Peso": 1.0})
+    return pd.concat(copies + [ring], ignore_index=True)[EDGE_COLUMNS]
+
+
+def scale_inventory(inventory, factor):
+    """``factor`` copias del inventario con números de producto distintos."""
+    if factor == 1:
+        return inventory
+    return pd.concat([inventory.assign(**{"Producto N°": inventory["Producto N°"] + f"-{i}"})
+                      for i in range(factor)], ignore_index=True)
+
+
+def measure(fn, repeat=3):
+    """Mejor tiempo de ``repeat`` corridas y pico de memoria de una corrida extra."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        if times[-1] > REPEAT_BUDGET:
+            break
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def filter_all(index):
+    # Primera página de cada combinación de filtros que ofrece la barra lateral
+    for comp in index.componentes:
+        for res in index.resultados(comp):
+            for crop in index.cultivos(comp, res):
+                index.page_html(index.rows(comp, res, crop), 0)
+
+
+def dataset_stages(edges, inventory, max_draw_nodes):
+    """Etapas ``(nombre, función, detalle)``; función ``None`` = omitida."""
+    index = InventoryIndex(inventory)
+    graph = CompactGraph.from_frame(edges)
+    G = graph.to_networkx()
+    n = graph.n_nodes
+    drawable = n <= max_draw_nodes
+    layout_items = tuple(sorted(SPRING_PARAMS.items()))
+    style_items = tuple(sorted(STATIC_STYLE.items()))
+    metrics = centralities(graph)
+
+    def static():
+        spring_layout(G)  # Layout ya medido en su propia etapa
+        return static_figure(graph, "Benchmark", "png", layout_items, style_items, G=G)
+
+    payload_bytes = len(json.dumps(graph_payload(graph, "bench"), default=str))
+    return [
+        ("inventario: índice", lambda: InventoryIndex(inventory), f"{len(inventory)} filas"),
+        ("inventario: filtros + página", lambda: filter_all(index), ""),
+        ("red: grafo compacto", lambda: CompactGraph.from_frame(edges), f"{n} nodos, {graph.n_edges} aristas"),
+        ("red: grafo networkx", graph.to_networkx, ""),
+        ("red: layout", (lambda: nx.spring_layout(G, **SPRING_PARAMS)) if drawable else None, ""),
+        ("red: figura estática", static if drawable else None, ""),
+        ("red: HTML PyVis", (lambda: pyvis_html(graph, "700px", INTERACTIVE_OPTIONS)) if drawable else None, ""),
+        ("red: payload componente", lambda: json.dumps(graph_payload(graph, "bench"), default=str),
+         f"{payload_bytes / 1024:.0f} KB"),
+        ("red: centralidades", lambda: centralities(graph), ""),
+        ("red: tabla de interpretación",
+         lambda: with_key_nodes(DEFAULT_DESCRIPTIONS.copy(), metrics).to_html(index=False), ""),
+    ]
+
+
+def image_stages():
+    def cold():
+        for path in BRIEF_IMAGES:
+            encode_image(path)
+
+    def warm():
+        for path in BRIEF_IMAGES:
+            image_bytes(path)
+
+    warm()
+    return [("imágenes: codificar", cold, f"{len(BRIEF_IMAGES)} páginas"),
+            ("imágenes: entrega en caché", warm, f"{len(BRIEF_IMAGES)} páginas")]
+
+
+def app_stages():
+    from streamlit.testing.v1 import AppTest
+
+    from cas.views import VIEWS
+
+    stages = []
+    for view in VIEWS:
+        def first_render(view=view):
+            at = AppTest.from_file("inventario.py", default_timeout=300)
+            at.run()
+            at.sidebar.selectbox[0].set_value(view).run()
+            if at.exception:
+                raise RuntimeError(f"{view}: {at.exception[0].message}")
+        stages.append((f"app: {view}", first_render, ""))
+    return stages
+
+
+def run(scales, app=False, repeat=3, max_draw_nodes=MAX_DRAW_NODES):
+    edges, inventory = bundled_edges(), load_inventory(INVENTORY_CSV)
+    results = []
+
+    def report(dataset, stage, fn, detail):
+        if fn is None:
+            row = {"datos": dataset, "etapa": stage, "segundos": None, "pico_mb": None, "detalle": "omitida"}
+        else:
+            seconds, peak = measure(fn, repeat)
+            row = {"datos": dataset, "etapa": stage, "segundos": seconds, "pico_mb": peak / 2**20,
+                   "detalle": detail}
+        results.append(row)
+        timing = "-" if row["segundos"] is None else f"{row['segundos'] * 1000:10.1f} ms"
+        peak = "-" if row["pico_mb"] is None else f"{row['pico_mb']:8.1f} MB"
+        print(f"{dataset:<6} {stage:<44} {timing:>13} {peak:>11}  {row['detalle']}", flush=True)
+
+    for factor in scales:
+        dataset = f"{factor}x"
+        for stage, fn, detail in dataset_stages(scale_edges(edges, factor), scale_inventory(inventory, factor),
+                                                max_draw_nodes):
+            report(dataset, stage, fn, detail)
+    for stage, fn, detail in image_stages():
+        report("1x", stage, fn, detail)
+    if app:
+        for stage, fn, detail in app_stages():
+            report("1x", stage, fn, detail)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100,1000",
+                        help="factores de escala separados por comas (por defecto 1,10,100,1000)")
+    parser.add_argument("--app", action="store_true", help="cronometrar también cada vista con AppTest")
+    parser.add_argument("--repeat", type=int, default=3, help="corridas por etapa (se toma la mejor)")
+    parser.add_argument("--max-draw-nodes", type=int, default=MAX_DRAW_NODES,
+                        help="omitir layout y dibujo por encima de este número de nodos")
+    parser.add_argument("--json", help="guardar los resultados en este archivo")
+    args = parser.parse_args(argv)
+
+    # Cachés en disco aislados: se mide en frío y no se ensucia data/.cache
+    tmp = tempfile.mkdtemp(prefix="cas-bench-")
+    cas.layouts.LAYOUT_DIR = f"{tmp}/layouts"
+    cas.data.COLUMNAR_DIR = f"{tmp}/columnar"
+    try:
+        results = run([int(s) for s in args.scales.split(",")], app=args.app, repeat=args.repeat,
+                      max_draw_nodes=args.max_draw_nodes)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""Motor de capacidad de los modelos de extensión.
+
+Los indicadores de cada organización viven en ``data/capacidad/<ORG>.csv``
+(formato largo: Escenario;Indicador;Valor;Nota) y el registro
+``organizaciones.csv`` asocia cada pestaña con su archivo. Todas las
+organizaciones y escenarios se apilan en una sola tabla (una fila por
+organización y escenario) y las métricas derivadas se calculan en una pasada
+vectorizada, memoizada por versión de los archivos (``cas.artifacts``). Las tarjetas HTML
+comparten una misma plantilla para todos los cultivos.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from cas.artifacts import STORE
+from cas.data import CAPACITY_DIR, CAPACITY_REGISTRY_CSV, load_capacity, load_capacity_registry
+
+# Indicadores de entrada que puede declarar cada organización
+INDICATORS = [
+    "comercializadoras",
+    "beneficiarios_comercializadoras",
+    "beneficiarios_pequenos",
+    "area_comercializadoras_ha",
+    "area_pequenos_ha",
+    "meta_anual_productores",
+    "meta_total_productores",
+    "anos_proyecto",
+    "meta_productores_comercializadoras",
+    "meta_productores_pequenos",
+    "meta_area_ha",
+    "extensionistas_campana",
+    "extensionistas_total",
+    "productores_nacionales",
+    "ha_promedio_productor",
+    "meta_oficial_ha",
+]
+
+
+def compute_metrics(wide):
+    """Métricas derivadas para todas las filas (organización, escenario) a la vez."""
+    m = wide.reindex(columns=INDICATORS).astype(float)
+    # Meta anual: declarada o repartida sobre los años del proyecto
+    m["meta_anual_productores"] = m["meta_anual_productores"].fillna(
+        m["meta_total_productores"] / m["anos_proyecto"])
+    m["beneficiarios_total"] = m["beneficiarios_comercializadoras"] + m["beneficiarios_pequenos"]
+    m["area_total_ha"] = m["area_comercializadoras_ha"] + m["area_pequenos_ha"]
+    m["pct_meta_comercializadoras"] = m["meta_productores_comercializadoras"] / m["meta_anual_productores"] * 100
+    m["pct_meta_pequenos"] = m["meta_productores_pequenos"] / m["meta_anual_productores"] * 100
+    m["pct_meta_area"] = m["meta_area_ha"] / m["area_total_ha"] * 100
+    m["productores_por_extensionista_campana"] = m["meta_anual_productores"] / m["extensionistas_campana"]
+    m["productores_por_extensionista"] = m["productores_nacionales"] / m["extensionistas_total"]
+    m["area_ano1_ha"] = m["meta_anual_productores"] * m["ha_promedio_productor"]
+    m["area_proyeccion_ha"] = m["area_ano1_ha"] * m["anos_proyecto"]
+    m["pct_avance_area"] = m["area_proyeccion_ha"] / m["meta_oficial_ha"] * 100
+    return m.replace([np.inf, -np.inf], np.nan)
+
+
+class CapacityTable:
+    def __init__(self, registry, long):
+        self.registry = registry.set_index("Pestaña")
+        if long.empty:
+            wide = pd.DataFrame(index=pd.MultiIndex.from_tuples([], names=["Organización", "Escenario"]))
+        else:
+            wide = long.pivot_table(index=["Organización", "Escenario"], columns="Indicador",
+                                    values="Valor", aggfunc="last")
+        self.metrics = compute_metrics(wide)
+        notes = long[long["Nota"] != ""]
+        self.notes = dict(zip(zip(notes["Organización"], notes["Indicador"]), notes["Nota"]))
+
+    @property
+    def tabs(self):
+        return list(self.registry.index)
+
+    def organization(self, tab):
+        """Fila del registro de la pestaña, o ``None`` si aún no tiene datos."""
+        if tab not in self.registry.index or not self.registry.at[tab, "Archivo"]:
+            return None
+        return self.registry.loc[tab]
+
+    def scenarios(self, org):
+        if org not in self.metrics.index.get_level_values(0):
+            return []
+        return list(self.metrics.loc[org].index)
+
+    def row(self, org, scenario):
+        return self.metrics.loc[(org, scenario)]
+
+    def note(self, org, indicator):
+        return self.notes.get((org, indicator), "")
+
+
+def get_capacity(registry_path=CAPACITY_REGISTRY_CSV):
+    return STORE.get(("capacity", registry_path), lambda: _build_capacity(registry_path))
+
+
+def _build_capacity(registry_path):
+    registry = load_capacity_registry(registry_path)
+    directory = os.path.dirname(registry_path) or CAPACITY_DIR
+    frames = [load_capacity(os.path.join(directory, name)).assign(Organización=org)
+              for org, name in zip(registry["Organización"], registry["Archivo"]) if name]
+    columns = ["Organización", "Escenario", "Indicador", "Valor", "Nota"]
+    long = pd.concat(frames, ignore_index=True)[columns] if frames else pd.DataFrame(columns=columns)
+    return CapacityTable(registry, long)
+
+
+# ---------------------------
+# Plantillas de tarjetas
+# ---------------------------
+# Hojas de estilo de las tarjetas y paneles (vista de capacidad y exportación estática)
+CAPACITY_STYLES = [
+    """
+    <style>
+      /* …tus reglas .info-card y .progress-bar… */
+    
+      /* NÚMEROS SIEMPRE EN NEGRO */
+      div.info-card h1,
+      div.info-card h2 {
+          color: #000000 !important;
+      }
+      /* CAFÉ: texto en tarjetas de panel-izquierdo y panel-derecho */
+      .panel-left .card p,
+      .panel-left .card p strong {
+          color: #000000 !important;
+      }
+      .panel-right .card p,
+      .panel-right .card p strong {
+          color: #FFFFFF !important;
+      }
+    </style>
+    """,
+    """
+    <style>
+    /* Estilos generales de tarjetas */
+    div.info-card {
+        background-color: #ffffff !important;
+        color: #000000 !important;
+        border: 1px solid #dddddd !important;
+        border-radius: 8px !important;
+        padding: 16px !important;
+        box-shadow: 2px 2px 6px rgba(0,0,0,0.1) !important;
+        margin-bottom: 16px !important;
+    }
+    div.info-card h2, div.info-card h1 { margin: 0 !important; }
+    div.info-card p { margin: 4px 0 8px !important; font-size:14px !important; color:#555 !important; }
+    div.info-card small { display:block !important; margin-top:4px !important; font-size:12px !important; color:#777 !important; }
+    div.info-card .progress-bar-container { background:#eee !important; border-radius:4px !important; overflow:hidden !important; height:20px !important; margin-top:6px !important; }
+    div.info-card .progress-bar { height:100% !important; background:#4CAF50 !important; text-align:right !important; padding-right:4px !important; color:#fff !important; font-size:12px !important; line-height:20px !important; }
+
+    /* Estilos panel café (FNC) */
+    .panel-left, .panel-right { padding:20px; border-radius:12px; margin-bottom:24px; }
+    .panel-left { background:#FFF3E0; } .panel-left h3 { color:#BF360C; font-size:24px; margin-bottom:16px; }
+    .panel-right { background:#33691E; } .panel-right h3 { color:#F1F8E9; font-size:24px; margin-bottom:16px; }
+    .card { display:flex; align-items:center; margin-bottom:12px; }
+    .card .icon { font-size:32px; margin-right:12px; }
+    .panel-left .icon { color:#BF360C; } .panel-right .icon { color:#F1F8E9; }
+    .panel-left p, .panel-right p { margin:0; line-height:1.3; }
+    .panel-right p { color:#F1F8E9; }
+    </style>
+    """,
+    """
+    <style>
+    /* Tarjetas Banano: fondo crema suave */
+    .banana-card {
+      background-color: #FFFDE7 !important;
+      border: 1px solid #FFEE58 !important;
+    }
+    .banana-card h2 {
+      font-size: 28px !important;
+      margin-bottom: 4px !important;
+    }
+    .banana-card p {
+      font-size: 13px !important;
+      color: #666 !important;
+    }
+    .banana-card small {
+      color: #999 !important;
+    }
+    /* Forzar texto en negro sobre la tarjeta de proyecto */
+    div.project-meta-card h3,
+    div.project-meta-card p,
+    div.project-meta-card p strong,
+    div.project-meta-card em {
+        color: #000000 !important;
+    }
+    </style>
+    """,
+]
+
+
+def fmt_number(value, decimals=0):
+    """Número con espacio como separador de miles (``1 733``, ``1,56``)."""
+    text = f"{value:,.{decimals}f}".replace(",", " ")
+    return text.replace(".", ",")
+
+
+def _card_classes(css_class):
+    return f"info-card {css_class}".strip()
+
+
+def progress_bar(pct, label=""):
+    bar = (f'<div class="progress-bar-container">'
+           f'<div class="progress-bar" style="width:{pct:.1f}%;">{pct:.1f}%</div></div>')
+    if label:
+        return (f'<div style="margin-top:12px;">'
+                f'<label style="font-size:14px; color:#333;">{label}</label>{bar}</div>')
+    return f'<div style="margin-top:12px;">{bar}</div>'
+
+
+def info_card(value, text, note="", css_class=""):
+    """Tarjeta de cifra: ``value`` grande, descripción y nota en letra pequeña."""
+    note_html = f"<small>{note}</small>" if note else ""
+    return (f'<div class="{_card_classes(css_class)}"><h2>{value}</h2>'
+            f'<p>{text}</p>{note_html}</div>')
+
+
+def goal_card(title, value, unit, base_note, bars, css_class=""):
+    """Tarjeta de meta: cifra principal con unidad y barras de avance ``[(label, pct)]``."""
+    bars_html = "".join(progress_bar(pct, label) for label, pct in bars)
+    return (f'<div class="{_card_classes(css_class)}">'
+            f'<p style="font-size:14px; color:#555; margin-bottom:4px;">{title}</p>'
+            f'<h1 style="font-size:48px; line-height:1; margin-bottom:4px;">{value} '
+            f'<span style="font-size:16px; vertical-align:super;">{unit}</span></h1>'
+            f'<small>{base_note}</small>{bars_html}</div>')
+
+
+def panel(title, items, side="left"):
+    """Panel de íconos (``[(icono, html)]``) con el estilo de los paneles de café."""
+    cards = "".join(f'<div class="card"><div class="icon">{icon}</div><p>{html}</p></div>'
+                    for icon, html in items)
+    return f'<div class="panel-{side}"><h3>{title}</h3>{cards}</div>'
+
+
+def project_area_card(project, year1_ha, annual_goal, avg_ha, years, projection_ha, official_ha, pct):
+    """Tarjeta de meta de área del proyecto: año 1, proyección y avance frente a la meta oficial."""
+    title = f"Meta: Área total a cubrir en proyecto {project}" if project else "Meta: Área total a cubrir en el proyecto"
+    return f"""
+<div class="info-card project-meta-card" style="border-radius:12px; border:2px solid #ccc; padding:20px;
+     background-color:#f5f5f5; width:100%;max-width:700px; box-shadow:2px 2px 10px rgba(0,0,0,0.1);
+     font-family:Arial,sans-serif; margin:30px auto;">
+<h3 style="margin-top:0;">{title}</h3>
+<p><strong>Año 1:</strong><br>
+📍 <span style="font-size:1.5em; font-weight:bold; color:#2E7D32;">{fmt_number(year1_ha)} ha estimadas</span><br>
+<span style="font-size:0.9em; color:#555;">(Meta de <strong>{fmt_number(annual_goal)} productores</strong> × {fmt_number(avg_ha, 2)} ha promedio)<br>
+<em>Nota: {fmt_number(avg_ha, 2)} ha es el promedio del área por productor</em></span></p>
+<p><strong>Proyección a {fmt_number(years)} años:</strong><br>
+📈 <span style="font-size:1.3em; font-weight:bold; color:#33691E;">{fmt_number(projection_ha)} ha estimadas</span><br>
+<span style="font-size:0.9em; color:#555;">(Valor estimado al término del proyecto)</span></p>
+<p><strong>Meta oficial del proyecto:</strong><br>
+🎯 <span style="font-size:1.2em; font-weight:bold; color:#D84315;">{fmt_number(official_ha)} hectáreas</span></p>
+<p><strong>Avance estimado:</strong> {fmt_number(pct, 1)}%</p>
+<div style="background-color:#ddd; border-radius:20px; overflow:hidden; height:20px; margin-top:5px;">
+<div style="width:{pct:.1f}%; background-color:#E53935; height:100%; text-align:center; color:white; font-weight:bold;">{pct:.1f}%</div>
+</div>
+</div>
+"""
+
+
+def organization_sections(capacity, org, scenario):
+    """Secciones del panel de ``org`` (fila del registro) en ``scenario``.
+
+    Cada sección es ``(subtítulo, columnas, separada)``: el HTML de cada columna
+    (``""`` = columna vacía) y si va precedida de un salto de línea. La vista de
+    Streamlit las dibuja con ``st.columns`` y la exportación estática
+    (``cas.export``) con una grilla CSS.
+    """
+    name, icon, css_class, project = org["Organización"], org["Icono"], org["Clase"], org["Proyecto"]
+    m = capacity.row(name, scenario)
+    sections = []
+
+    def has(*columns):
+        return all(pd.notna(m[c]) for c in columns)
+
+    # ==== Potenciales beneficiarios ====
+    if has("beneficiarios_comercializadoras", "beneficiarios_pequenos"):
+        companies = f"{fmt_number(m['comercializadoras'])} " if has("comercializadoras") else ""
+        sections.append((f"{icon} Potenciales beneficiarios y áreas sembradas – {name}", [
+            info_card(f"{icon} {fmt_number(m['beneficiarios_comercializadoras'])}",
+                      f"Pot. beneficiarios:<br><strong>{companies}Comercializadoras</strong>",
+                      capacity.note(name, "beneficiarios_comercializadoras"), css_class),
+            info_card(f"👩‍🌾 {fmt_number(m['beneficiarios_pequenos'])}",
+                      "Pot. beneficiarios:<br><strong>Pequeños Prod.</strong>",
+                      capacity.note(name, "beneficiarios_pequenos"), css_class),
+            info_card(f"📋 {fmt_number(m['beneficiarios_total'])}", "Total pot. beneficiarios",
+                      "Suma: comercializadoras + pequeños productores", css_class),
+        ], False))
+
+    # ==== Áreas sembradas ====
+    if has("area_comercializadoras_ha", "area_pequenos_ha"):
+        companies = f"{fmt_number(m['comercializadoras'])} empresas" if has("comercializadoras") else "las comercializadoras"
+        large = fmt_number(m["area_comercializadoras_ha"])
+        small = fmt_number(m["area_pequenos_ha"])
+        sections.append((None, [
+            info_card(f"{large} ha", "Área sembrada<br>Grandes Comercializadoras",
+                      f"{large} ha gestionadas por {companies}"),
+            info_card(f"{small} ha", "Área sembrada<br>Pequeños Productores",
+                      f"{small} ha gestionadas por productores pequeños"),
+        ], True))
+
+    # ==== Meta anual de productores ====
+    if has("meta_anual_productores", "meta_productores_comercializadoras", "meta_productores_pequenos"):
+        goal = fmt_number(m["meta_anual_productores"])
+        sections.append((None, [goal_card("Meta anual de productores", goal, "Productores",
+                                          f"Base 100% = {goal} productores", [
+            (f"• Grandes Comercializadoras ({fmt_number(m['meta_productores_comercializadoras'])}/{goal})",
+             m["pct_meta_comercializadoras"]),
+            (f"• Pequeños Productores ({fmt_number(m['meta_productores_pequenos'])}/{goal})",
+             m["pct_meta_pequenos"]),
+        ])], True))
+
+    # ==== Meta de hectáreas ====
+    if has("meta_area_ha", "area_total_ha"):
+        sections.append((None, [goal_card("Meta: Total hectáreas a cubrir en el proyecto",
+                                          fmt_number(m["meta_area_ha"]), "ha",
+                                          f"Base 100% area total de {name}= {fmt_number(m['area_total_ha'])} ha",
+                                          [("", m["pct_meta_area"])], css_class)], True))
+
+    # ==== Paneles de campañas y capacidad de extensionistas ====
+    if has("meta_total_productores", "extensionistas_campana") or has("extensionistas_total", "productores_nacionales"):
+        left = right = ""
+        if has("meta_total_productores", "extensionistas_campana"):
+            campaigns = f"Campañas planeadas por {name}" + (f" en {project}" if project else "")
+            left = panel(f"Meta anual de beneficiarios: {campaigns}", [
+                ("🎯", f"<strong>{fmt_number(m['meta_total_productores'])} productores</strong> "
+                       f"({fmt_number(m['meta_anual_productores'])}/año)"),
+                ("👥", f"<strong>{fmt_number(m['extensionistas_campana'])} extensionistas</strong> / campaña"),
+                ("📈", f"<strong>{fmt_number(m['productores_por_extensionista_campana'])} productores</strong> "
+                       "/ extensionista/año"),
+            ], side="left")
+        if has("extensionistas_total", "productores_nacionales"):
+            items = [("🤝", f"<strong>{fmt_number(m['extensionistas_total'])} extensionistas</strong>"),
+                     (icon, f"<strong>{fmt_number(m['productores_nacionales'])} productores</strong> en territorio nacional")]
+            if capacity.note(name, "extensionistas_total"):
+                items.append(("⏰", capacity.note(name, "extensionistas_total")))
+            items.append(("👨‍🌾", f"<strong>{fmt_number(m['productores_por_extensionista'])} productores</strong> "
+                                  "por extensionista"))
+            right = panel(f"Índice: Capacidad-cobertura total de extensionistas de {name}", items, side="right")
+        sections.append((None, [left, right], False))
+
+    # ==== Meta de área del proyecto ====
+    if has("area_ano1_ha", "area_proyeccion_ha", "meta_oficial_ha"):
+        sections.append((None, [project_area_card(project, m["area_ano1_ha"], m["meta_anual_productores"],
+                                                  m["ha_promedio_productor"], m["anos_proyecto"],
+                                                  m["area_proyeccion_ha"], m["meta_oficial_ha"],
+                                                  m["pct_avance_area"])], False))
+    return sections
@@ -0,0 +1,161 @@
+"""Grafo combinado de todas las redes de extensión.
+
+Une las redes de ``cas.networks.NETWORKS`` en un solo índice: los actores con
+el mismo nombre (sin distinguir mayúsculas, tildes ni espacios repetidos) se
+fusionan en un único nodo que recuerda en qué redes aparece. Las listas de
+adyacencia (salientes y no dirigidas) se precalculan una vez por versión de
+los CSV a partir del ``CompactGraph`` de cada red (misma regla para aristas
+repetidas y misma ingesta por bloques que las vistas por cultivo), de modo que
+caminos más cortos, vecindarios a k saltos y actores puente entre cultivos se
+responden con búsquedas por niveles sobre arreglos, sin reconstruir ni
+recorrer los grafos de cada red.
+"""
+import unicodedata
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cas.artifacts import STORE
+from cas.graphs import ACTOR_TYPE_ARRAY, actor_type_codes, get_compact
+from cas.metrics import _frontier_edges, csr
+from cas.networks import NETWORKS
+
+
+def normalize_name(name):
+    """Clave de fusión de actores: sin tildes, en minúsculas y con espacios simples."""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.split()).casefold()
+
+
+class CombinedGraph:
+    """Redes fusionadas con índices de adyacencia para consultas entre cultivos.
+
+    ``actors`` tiene una fila por actor único (nombre mostrado, tipo de actor,
+    redes en las que aparece y grado); ``edges`` una fila por par dirigido de
+    actores con el peso sumado entre redes y las redes que lo contienen.
+    """
+
+    def __init__(self, graphs):
+        # Una fila por arista única de cada red (``CompactGraph``)
+        frames = [pd.DataFrame({"Origen": g.names[g.src], "Destino": g.names[g.dst],
+                                "Peso": g.weight, "Red": key})
+                  for key, g in graphs.items()]
+        df = pd.concat(frames, ignore_index=True)
+        origin, target = df["Origen"].map(normalize_name), df["Destino"].map(normalize_name)
+
+        # Nombre mostrado: la primera grafía encontrada de cada actor
+        names = pd.concat([pd.Series(df["Origen"].values, index=origin.values),
+                           pd.Series(df["Destino"].values, index=target.values)])
+        names = names[~names.index.duplicated()]
+        self._index = {key: i for i, key in enumerate(names.index)}
+        self.names = names.to_numpy(dtype=object)
+        n = len(self.names)
+
+        src = origin.map(self._index).to_numpy(dtype=np.int64)
+        dst = target.map(self._index).to_numpy(dtype=np.int64)
+        pairs = pd.DataFrame({"src": src, "dst": dst, "weight": df["Peso"].fillna(0).to_numpy(),
+                              "Red": df["Red"].to_numpy()})
+        grouped = pairs.groupby(["src", "dst"], sort=True)
+        self.edges = pd.DataFrame({
+            "weight": grouped["weight"].sum(),
+            "networks": grouped["Red"].agg(lambda reds: tuple(dict.fromkeys(reds))),
+        }).reset_index()
+        self.src = self.edges["src"].to_numpy()
+        self.dst = self.edges["dst"].to_numpy()
+
+        # Redes de cada actor, en el orden del registro
+        membership = pd.concat([pd.DataFrame({"node": src, "Red": pairs["Red"]}),
+                                pd.DataFrame({"node": dst, "Red": pairs["Red"]})])
+        membership = membership.drop_duplicates()
+        order = {key: i for i, key in enumerate(graphs)}
+        membership = membership.assign(order=membership["Red"].map(order)).sort_values(["node", "order"])
+        networks = membership.groupby("node")["Red"].agg(tuple)
+
+        degree = np.bincount(self.src, minlength=n) + np.bincount(self.dst, minlength=n)
+        self.actors = pd.DataFrame({
+            "Actor": self.names,
+            "Tipo": ACTOR_TYPE_ARRAY[actor_type_codes(self.names)],
+            "Redes": networks.reindex(range(n)).to_numpy(),
+            "Conexiones": degree,
+        })
+        self.actors["Número de redes"] = self.actors["Redes"].map(len)
+
+        # Índices de adyacencia: salientes y en ambos sentidos
+        self._out = csr(n, self.src, self.dst)
+        self._both = csr(n, np.concatenate([self.src, self.dst]), np.concatenate([self.dst, self.src]))
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, name):
+        """Posición del actor ``name`` (KeyError si no está en ninguna red)."""
+        try:
+            return self._index[normalize_name(name)]
+        except KeyError:
+            raise KeyError(f"El actor '{name}' no aparece en ninguna red") from None
+
+    def _adjacency(self, directed):
+        return self._out if directed else self._both
+
+    def _bfs(self, source, directed, max_depth=None, target=None):
+        """Distancias y predecesores desde ``source``, por niveles."""
+        indptr, indices = self._adjacency(directed)
+        n = len(self)
+        dist = np.full(n, -1, dtype=np.int64)
+        parent = np.full(n, -1, dtype=np.int64)
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while frontier.size and (max_depth is None or level < max_depth):
+            if target is not None and dist[target] >= 0:
+                break
+            eu, ev = _frontier_edges(indptr, indices, frontier)
+            fresh = dist[ev] < 0
+            eu, ev = eu[fresh], ev[fresh]
+            # Primer predecesor de cada nodo nuevo
+            frontier, first = np.unique(ev, return_index=True)
+            parent[frontier] = eu[first]
+            level += 1
+            dist[frontier] = level
+        return dist, parent
+
+    def shortest_path(self, origin, target, directed=False):
+        """Actores del camino más corto de ``origin`` a ``target`` (lista vacía si no hay)."""
+        s, t = self.find(origin), self.find(target)
+        dist, parent = self._bfs(s, directed, target=t)
+        if dist[t] < 0:
+            return []
+        path = [t]
+        while path[-1] != s:
+            path.append(parent[path[-1]])
+        return [self.names[i] for i in reversed(path)]
+
+    def neighborhood(self, actor, k=1, directed=False):
+        """Actores a ``k`` saltos o menos de ``actor``, con su distancia."""
+        dist, _ = self._bfs(self.find(actor), directed, max_depth=k)
+        reached = np.flatnonzero(dist > 0)
+        table = self.actors.iloc[reached].assign(Distancia=dist[reached])
+        return table.sort_values(["Distancia", "Conexiones"], ascending=[True, False], kind="stable")
+
+    def bridging_actors(self):
+        """Actores presentes en más de una red, de mayor a menor alcance."""
+        table = self.actors[self.actors["Número de redes"] > 1]
+        return table.sort_values(["Número de redes", "Conexiones"], ascending=False, kind="stable")
+
+    def to_networkx(self):
+        """Grafo dirigido congelado con los atributos de actores y aristas."""
+        G = nx.DiGraph()
+        for row in self.actors.itertuples(index=False):
+            G.add_node(row.Actor, actor_type=row.Tipo, networks=row.Redes, degree=row.Conexiones)
+        G.add_edges_from(
+            (self.names[u], self.names[v], {"weight": w, "networks": reds})
+            for u, v, w, reds in self.edges.itertuples(index=False)
+        )
+        return nx.freeze(G)
+
+
+def get_combined_graph():
+    """Grafo combinado de todas las redes registradas, compartido entre sesiones."""
+    return STORE.get(("combined",), lambda: CombinedGraph({key: get_compact(key) for key in NETWORKS}))
@@ -0,0 +1,28 @@
+"""Componente Streamlit para la red interactiva con recursos locales.
+
+La plantilla ``lib/index.html`` y el vis-network vendorizado en
+``lib/vis-9.1.2`` se sirven desde el propio servidor de Streamlit (sin CDN,
+apto para despliegues sin internet) y el navegador los guarda en caché. Al
+cambiar de pestaña el iframe se reutiliza y solo viaja el JSON de la red.
+
+``CAS_INTERACTIVE_MODE=pyvis`` vuelve al documento HTML completo de PyVis.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+INTERACTIVE_MODE = os.environ.get("CAS_INTERACTIVE_MODE", "component")
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib")
+
+_network_component = components.declare_component("network", path=LIB_DIR)
+
+
+def network_component(payload, height="700px", key=None, on_change=None):
+    """Dibuja ``payload`` (ver ``cas.render.network_payload``) en el iframe compartido.
+
+    Devuelve el último clic sobre un grupo de la red agregada
+    (``{"node": id, "clicks": n}``), o ``None``. Los componentes no aceptan
+    ``args``: ``on_change`` se llama sin argumentos (usar ``functools.partial``).
+    """
+    return _network_component(height=height, key=key, default=None, on_change=on_change, **payload)
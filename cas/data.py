@@ -0,0 +1,281 @@
+"""Acceso centralizado a los CSV de ``data/``.
+
+Cada cargador está memoizado por ruta y versión del archivo (``mtime`` y
+tamaño), de modo que en cada rerun de Streamlit la lectura se reduce a una
+búsqueda en diccionario y solo se vuelve a parsear cuando el archivo cambia.
+Cada lectura queda registrada (``cas.artifacts.track``) como dependencia de
+los artefactos que se estén construyendo. Los DataFrames devueltos son
+compartidos entre sesiones: no modificarlos.
+
+Al ingerir un CSV se valida contra su esquema (``SCHEMAS``), se normaliza y se
+guarda en formato columnar (Feather) en ``COLUMNAR_DIR``. Los procesos
+siguientes cargan ese archivo en lugar de parsear el CSV (la tabla Arrow se
+abre con memory-map y se convierte, copiándola, a un DataFrame de pandas con
+los mismos tipos que da el CSV) y solo vuelven al CSV cuando la versión de la
+fuente o la del formato (``COLUMNAR_VERSION``) no coincide con la registrada en
+el caché.
+"""
+import hashlib
+import logging
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from cas import profiling
+from cas.artifacts import track
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # Sin pyarrow se leen siempre los CSV
+    pa = feather = None
+
+logger = logging.getLogger("cas")
+
+# Directorio de datos; ``CAS_DATA_DIR`` apunta la app a otro conjunto (p. ej. uno
+# generado con ``python -m cas.generate``). Las imágenes siguen en ``data/``.
+DATA_DIR = os.environ.get("CAS_DATA_DIR", "data")
+INVENTORY_CSV = os.path.join(DATA_DIR, "Inventary2.csv")
+CAPACITY_DIR = os.path.join(DATA_DIR, "capacidad")
+CAPACITY_REGISTRY_CSV = os.path.join(CAPACITY_DIR, "organizaciones.csv")
+
+# Columnas del inventario que se tratan como texto
+INVENTORY_STR_COLUMNS = ["Componente", "Resultado", "Cultivos Asociados", "Producto N°"]
+# Columnas que además muestran las tarjetas del inventario (``cas.inventory.card_html``)
+INVENTORY_CARD_COLUMNS = ["Descripción", "Avance Identificado", "Estado"]
+
+# Columnas normalizadas de los CSV de red
+EDGE_COLUMNS = ["Origen", "Destino", "Tipo de Interacción", "Peso"]
+
+# Columnas obligatorias de cada tipo de archivo, tras normalizar los encabezados
+SCHEMAS = {
+    "inventory": INVENTORY_STR_COLUMNS + INVENTORY_CARD_COLUMNS,
+    "network_edges": EDGE_COLUMNS,
+    "interpretation": ["Métrica"],
+    "capacity_registry": ["Pestaña", "Organización", "Archivo"],
+    "capacity": ["Indicador", "Valor"],
+}
+
+COLUMNAR_DIR = os.path.join(DATA_DIR, ".cache", "columnar")
+_SOURCE_KEY = b"cas.source_version"
+# Cambiar cuando cambien los ``parse_*``, ``SCHEMAS`` o el formato del caché
+COLUMNAR_VERSION = 2
+
+
+def file_version(path):
+    """Versión de un archivo: cambia cada vez que se edita en disco."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_inventory(path=INVENTORY_CSV):
+    version = file_version(path)
+    track(path, version)
+    return _read_inventory(path, version)
+
+
+def load_network_edges(path):
+    version = file_version(path)
+    track(path, version)
+    return _read_network_edges(path, version)
+
+
+def load_interpretation(path):
+    version = file_version(path)
+    track(path, version)
+    return _read_interpretation(path, version)
+
+
+def load_capacity_registry(path=CAPACITY_REGISTRY_CSV):
+    version = file_version(path)
+    track(path, version)
+    return _read_capacity_registry(path, version)
+
+
+def load_capacity(path):
+    version = file_version(path)
+    track(path, version)
+    return _read_capacity(path, version)
+
+
+class SchemaError(ValueError):
+    """El CSV no tiene las columnas que declara su esquema."""
+
+
+def validate(df, kind, path):
+    missing = [c for c in SCHEMAS[kind] if c not in df.columns]
+    if missing:
+        raise SchemaError(f"{path}: faltan las columnas {', '.join(missing)}")
+
+
+def columnar_path(kind, path):
+    # Nombre estable y sin espacios (p. ej. "red cana.csv")
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:12]
+    return os.path.join(COLUMNAR_DIR, f"{kind}-{digest}.feather")
+
+
+def _ingest(kind, path, version):
+    """DataFrame normalizado de ``path``: del caché columnar si está al día, si no del CSV."""
+    cache = columnar_path(kind, path)
+    with profiling.stage(f"cargar {kind}"):
+        df = _read_columnar(cache, version)
+        profiling.count("columnar", "miss" if df is None else "hit")
+        if df is None:
+            df = PARSERS[kind](path)
+            _write_columnar(cache, df, version)
+    return df
+
+
+def _version_tag(version):
+    return f"{COLUMNAR_VERSION}:{version[0]}:{version[1]}".encode()
+
+
+def _read_columnar(cache, version):
+    if feather is None or not os.path.exists(cache):
+        return None
+    try:
+        table = feather.read_table(cache, memory_map=True)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(_SOURCE_KEY) != _version_tag(version):
+        return None
+    df = table.to_pandas()
+    # Arrow devuelve None en las celdas vacías de texto; el CSV daba NaN
+    text = df.columns[df.dtypes == object]
+    df[text] = df[text].fillna(np.nan)
+    return df
+
+
+def _write_columnar(cache, df, version):
+    if feather is None:
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, _SOURCE_KEY: _version_tag(version)})
+        os.makedirs(COLUMNAR_DIR, exist_ok=True)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        feather.write_feather(table, tmp)
+        os.replace(tmp, cache)
+    except (OSError, pa.ArrowException) as e:
+        # Columnas con tipos mezclados o disco de solo lectura: se sigue con el CSV
+        logger.warning("No se pudo escribir el caché columnar de %s: %s", cache, e)
+
+
+def _drop_empty_columns(df):
+    # Columnas vacías generadas por separadores finales (p. ej. ";;;" en ASBAMA.csv)
+    unnamed = [c for c in df.columns if str(c).startswith("Unnamed:") and df[c].isna().all()]
+    return df.drop(columns=unnamed)
+
+
+def parse_inventory(path):
+    df = pd.read_csv(path, sep=';')
+    df = _drop_empty_columns(df)
+    validate(df, "inventory", path)
+    for col in INVENTORY_STR_COLUMNS:
+        df[col] = df[col].astype(str)
+    return df
+
+
+def parse_network_edges(path):
+    df = pd.read_csv(path, sep=';', on_bad_lines='skip')
+    df = _drop_empty_columns(df)
+    df.columns = [str(c).strip() for c in df.columns]
+    # "Periodicidad de la Interacción" (con variaciones de mayúsculas) -> "Peso"
+    df = df.rename(columns={c: "Peso" for c in df.columns
+                            if c.lower() == "periodicidad de la interacción"})
+    validate(df, "network_edges", path)
+    df = df.dropna(subset=["Origen", "Destino"])
+    df["Origen"] = df["Origen"].astype(str)
+    df["Destino"] = df["Destino"].astype(str)
+    df["Tipo de Interacción"] = df["Tipo de Interacción"].fillna("").astype(str)
+    df["Peso"] = pd.to_numeric(df["Peso"], errors="coerce")
+    return df[EDGE_COLUMNS].reset_index(drop=True)
+
+
+def parse_interpretation(path):
+    df = pd.read_csv(path, sep=';', header=0)
+    df = _drop_empty_columns(df)
+    # Si la primera fila es idéntica a los encabezados, eliminarla
+    if len(df) and df.iloc[0].tolist() == list(df.columns):
+        df = df.iloc[1:].reset_index(drop=True)
+    validate(df, "interpretation", path)
+    return df
+
+
+def parse_capacity_registry(path):
+    # Pestaña;Organización;Archivo;Icono;Clase;Proyecto (Archivo vacío = "En construcción")
+    df = pd.read_csv(path, sep=';', dtype=str).fillna("")
+    validate(df, "capacity_registry", path)
+    return df.apply(lambda col: col.str.strip())
+
+
+def parse_capacity(path):
+    # Escenario;Indicador;Valor;Nota en formato largo
+    df = pd.read_csv(path, sep=';', dtype={"Indicador": str, "Nota": str})
+    validate(df, "capacity", path)
+    if "Escenario" not in df.columns:
+        df["Escenario"] = "Base"
+    if "Nota" not in df.columns:
+        df["Nota"] = ""
+    df["Escenario"] = df["Escenario"].fillna("Base").astype(str).str.strip()
+    df["Indicador"] = df["Indicador"].str.strip()
+    df["Valor"] = pd.to_numeric(df["Valor"], errors="coerce")
+    df["Nota"] = df["Nota"].fillna("")
+    return df[["Escenario", "Indicador", "Valor", "Nota"]]
+
+
+PARSERS = {
+    "inventory": parse_inventory,
+    "network_edges": parse_network_edges,
+    "interpretation": parse_interpretation,
+    "capacity_registry": parse_capacity_registry,
+    "capacity": parse_capacity,
+}
+
+
+@lru_cache(maxsize=4)
+def _read_inventory(path, version):
+    return _ingest("inventory", path, version)
+
+
+@lru_cache(maxsize=32)
+def _read_network_edges(path, version):
+    return _ingest("network_edges", path, version)
+
+
+@lru_cache(maxsize=32)
+def _read_interpretation(path, version):
+    return _ingest("interpretation", path, version)
+
+
+@lru_cache(maxsize=4)
+def _read_capacity_registry(path, version):
+    return _ingest("capacity_registry", path, version)
+
+
+@lru_cache(maxsize=32)
+def _read_capacity(path, version):
+    return _ingest("capacity", path, version)
+
+
+def ingest():
+    """Valida y pasa a formato columnar todos los CSV conocidos (``python -m cas.data``)."""
+    from cas.networks import NETWORKS
+
+    sources = [("inventory", INVENTORY_CSV), ("capacity_registry", CAPACITY_REGISTRY_CSV)]
+    for spec in NETWORKS.values():
+        sources += [("network_edges", spec.edges), ("interpretation", spec.interpretation)]
+    registry = load_capacity_registry()
+    sources += [("capacity", os.path.join(CAPACITY_DIR, name)) for name in registry["Archivo"] if name]
+    for kind, path in sources:
+        if not os.path.exists(path):
+            print(f"{path}: no existe")
+            continue
+        df = _ingest(kind, path, file_version(path))
+        print(f"{path}: {len(df)} filas -> {columnar_path(kind, path)}")
+
+
+if __name__ == "__main__":
+    ingest()
@@ -0,0 +1,219 @@
+"""Ingesta por bloques de listas de aristas grandes.
+
+``stream_edges`` lee un CSV de aristas (Origen;Destino;Tipo de Interacción;
+Periodicidad...) por bloques de ``CHUNK_ROWS`` filas y agrega las aristas
+repetidas sobre la marcha: los nombres se internan como enteros y cada par
+(origen, destino) acumula su número de filas y su peso según la regla de la red
+(``NetworkSpec.duplicates``): ``"last"`` conserva la última fila (peso y tipo de
+interacción), ``"sum"`` y ``"mean"`` suman o promedian los pesos y guardan una
+vez por par cada tipo de interacción distinto. La memoria crece con el número de
+aristas únicas, no con el de filas. ``collapse_edges`` aplica las mismas reglas a
+una red ya cargada en memoria.
+
+El resultado es un ``EdgeTable`` respaldado por arreglos NumPy (ids
+``int32``, peso ``float32``), en el orden en que aparece cada arista por
+primera vez.
+"""
+import numpy as np
+import pandas as pd
+
+from cas.artifacts import STORE, track
+from cas.data import EDGE_COLUMNS, validate
+
+CHUNK_ROWS = 200_000
+AGGREGATIONS = ("sum", "mean", "last")
+LABEL_SEPARATOR = " / "
+
+
+class EdgeTable:
+    """Aristas únicas de una red en arreglos compactos.
+
+    ``names[src[i]] -> names[dst[i]]`` es la arista ``i``, con peso
+    ``weight[i]``, ``rows[i]`` filas de origen y tipos de interacción
+    ``label_names[label_ids[label_ptr[i]:label_ptr[i + 1]]]``.
+    """
+
+    def __init__(self, names, src, dst, weight, rows, label_names, label_ptr, label_ids):
+        self.names = names
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.rows = rows
+        self.label_names = label_names
+        self.label_ptr = label_ptr
+        self.label_ids = label_ids
+
+    def __len__(self):
+        return len(self.src)
+
+    @property
+    def nbytes(self):
+        """Bytes de los arreglos numéricos (sin contar los nombres)."""
+        return sum(a.nbytes for a in (self.src, self.dst, self.weight, self.rows, self.label_ptr, self.label_ids))
+
+    def labels(self, i):
+        return list(self.label_names[self.label_ids[self.label_ptr[i]:self.label_ptr[i + 1]]])
+
+    def joined_labels(self):
+        """Tipos de interacción de cada arista unidos por ``LABEL_SEPARATOR``."""
+        labels = self.label_names[self.label_ids]
+        starts, counts = self.label_ptr[:-1], np.diff(self.label_ptr)
+        joined = np.full(len(self), "", dtype=object)
+        # La mayoría de las aristas tiene un solo tipo: se toman sin unir cadenas
+        single = counts == 1
+        joined[single] = labels[starts[single]]
+        values, ptr = labels.tolist(), self.label_ptr.tolist()
+        for i in np.flatnonzero(counts > 1).tolist():
+            joined[i] = LABEL_SEPARATOR.join(values[ptr[i]:ptr[i + 1]])
+        return joined
+
+    def to_frame(self):
+        """DataFrame con las columnas normalizadas de ``cas.data`` (tipos unidos por ``LABEL_SEPARATOR``)."""
+        return pd.DataFrame({
+            "Origen": self.names[self.src],
+            "Destino": self.names[self.dst],
+            "Tipo de Interacción": self.joined_labels(),
+            "Peso": self.weight.astype(np.float64),
+        }, columns=EDGE_COLUMNS)
+
+
+def _header(path):
+    # Mismas normalizaciones de encabezado que ``cas.data.parse_network_edges``
+    columns = pd.read_csv(path, sep=";", nrows=0).columns
+    renamed = {}
+    for column in columns:
+        name = str(column).strip()
+        if name.lower() == "periodicidad de la interacción":
+            name = "Peso"
+        renamed[column] = name
+    validate(pd.DataFrame(columns=list(renamed.values())), "network_edges", path)
+    return {name: column for column, name in renamed.items() if name in EDGE_COLUMNS}
+
+
+class _Interner:
+    """Asigna enteros consecutivos a cadenas, en orden de aparición."""
+
+    def __init__(self):
+        self.index = pd.Index([], dtype=object)
+
+    def codes(self, values):
+        # Se factoriza el bloque primero: el índice global solo ve valores distintos
+        local, uniques = pd.factorize(values)
+        codes = self.index.get_indexer(uniques)
+        new = codes < 0
+        if new.any():
+            self.index = self.index.append(pd.Index(uniques[new]))
+            codes[new] = self.index.get_indexer(uniques[new])
+        return codes[local]
+
+
+def _check_aggregation(how):
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Agregación desconocida: {how} (opciones: {', '.join(AGGREGATIONS)})")
+
+
+def collapse_edges(df_net, how="sum"):
+    """Una fila por par (origen, destino) de ``df_net``, en orden de primera aparición.
+
+    Mismas reglas que ``stream_edges`` sobre las columnas normalizadas de
+    ``cas.data``; con ``"last"`` se conserva el tipo del peso (entero si no hay
+    pesos vacíos).
+    """
+    _check_aggregation(how)
+    pair = ["Origen", "Destino"]
+    grouped = df_net.groupby(pair, sort=False)
+    if how == "last":
+        # Cada par en la posición de su primera fila con los valores de la última
+        keep = ~df_net.duplicated(pair, keep="last").to_numpy()
+        order = np.argsort(grouped.ngroup().to_numpy()[keep], kind="stable")
+        return df_net[keep].iloc[order].reset_index(drop=True)
+    weight = grouped["Peso"].sum(min_count=1) if how == "sum" else grouped["Peso"].mean()
+    labels = grouped["Tipo de Interacción"].agg(lambda values: LABEL_SEPARATOR.join(dict.fromkeys(values)))
+    return pd.DataFrame({"Tipo de Interacción": labels, "Peso": weight}).reset_index()[EDGE_COLUMNS]
+
+
+def stream_edges(path, how="sum", chunksize=CHUNK_ROWS):
+    """``EdgeTable`` del CSV ``path`` con las aristas repetidas agregadas según ``how``."""
+    _check_aggregation(how)
+    columns = _header(path)
+    nodes, labels = _Interner(), _Interner()
+    # Acumuladores por par, indexados por clave origen << 32 | destino
+    acc = pd.DataFrame({"first": pd.Series(dtype=np.int64), "total": pd.Series(dtype=np.float64),
+                        "counted": pd.Series(dtype=np.int64), "rows": pd.Series(dtype=np.int64),
+                        "last": pd.Series(dtype=np.float64), "label": pd.Series(dtype=np.int64)})
+    pair_labels = pd.DataFrame({"key": pd.Series(dtype=np.int64), "label": pd.Series(dtype=np.int64)})
+    offset = 0
+
+    text = {columns[name]: str for name in ("Origen", "Destino", "Tipo de Interacción")}
+    reader = pd.read_csv(path, sep=";", usecols=list(columns.values()), dtype=text, chunksize=chunksize,
+                         on_bad_lines="skip")
+    for chunk in reader:
+        chunk = chunk.rename(columns={column: name for name, column in columns.items()})
+        chunk = chunk.dropna(subset=["Origen", "Destino"])
+        origin = chunk["Origen"].to_numpy(dtype=object)
+        target = chunk["Destino"].to_numpy(dtype=object)
+        # Intercalados para que los ids sigan el orden de aparición (origen, destino, ...)
+        codes = nodes.codes(np.column_stack([origin, target]).ravel())
+        key = (codes[0::2].astype(np.int64) << 32) | codes[1::2].astype(np.int64)
+        weight = pd.to_numeric(chunk["Peso"], errors="coerce").to_numpy(dtype=np.float64)
+        label = labels.codes(chunk["Tipo de Interacción"].fillna("").to_numpy(dtype=object))
+        rows = pd.DataFrame({"key": key, "first": np.arange(offset, offset + len(key)), "total": weight,
+                             "counted": ~np.isnan(weight), "rows": 1, "last": weight, "label": label})
+        offset += len(chunk)
+
+        acc = _merge(acc, rows.set_index("key"))
+
+        if how != "last":
+            pair_labels = pd.concat([pair_labels, pd.DataFrame({"key": key, "label": label})]).drop_duplicates()
+
+    acc = acc.sort_values("first")
+    key = acc.index.to_numpy(dtype=np.int64)
+    if how == "sum":
+        weight = acc["total"].where(acc["counted"] > 0)
+    elif how == "mean":
+        weight = acc["total"] / acc["counted"].where(acc["counted"] > 0)
+    else:
+        weight = acc["last"]
+
+    if how == "last":
+        # Un solo tipo de interacción por par: el de su última fila
+        label_ptr = np.arange(len(key) + 1, dtype=np.int64)
+        label_ids = acc["label"].to_numpy(dtype=np.int32)
+    else:
+        # Tipos de interacción de cada par, en el orden de las aristas
+        position = pd.Series(np.arange(len(key)), index=key)
+        pair_labels = pair_labels.assign(edge=position.reindex(pair_labels["key"]).to_numpy())
+        pair_labels = pair_labels.sort_values("edge", kind="stable")
+        label_ptr = np.zeros(len(key) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_labels["edge"], minlength=len(key)), out=label_ptr[1:])
+        label_ids = pair_labels["label"].to_numpy(dtype=np.int32)
+
+    return EdgeTable(
+        names=nodes.index.to_numpy(dtype=object),
+        src=(key >> 32).astype(np.int32),
+        dst=(key & 0xFFFFFFFF).astype(np.int32),
+        weight=weight.to_numpy(dtype=np.float32),
+        rows=acc["rows"].to_numpy(dtype=np.int32),
+        label_names=labels.index.to_numpy(dtype=object),
+        label_ptr=label_ptr,
+        label_ids=label_ids,
+    )
+
+
+def _merge(acc, rows):
+    """Agrega las filas de un bloque a los acumuladores por par."""
+    both = pd.concat([acc, rows]) if len(acc) else rows
+    grouped = both.groupby(level=0, sort=False)
+    merged = grouped.agg(first=("first", "min"), total=("total", "sum"), counted=("counted", "sum"),
+                         rows=("rows", "sum"))
+    # Última fila de cada par, aunque su peso esté vacío (``how="last"``)
+    last = both.loc[~both.index.duplicated(keep="last"), ["last", "label"]]
+    return merged.join(last)
+
+
+def load_edge_table(path, how="sum"):
+    """``EdgeTable`` de ``path``, compartido entre sesiones y al día con el archivo."""
+    def build():
+        track(path)
+        return stream_edges(path, how)
+    return STORE.get(("edge_table", path, how), build)
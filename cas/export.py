@@ -0,0 +1,302 @@
+"""Exportación del tablero a un sitio estático de solo lectura.
+
+Dibuja todas las vistas una sola vez y las escribe como HTML, imágenes y
+JSON embebido, listos para cualquier servidor de archivos estáticos::
+
+    python -m cas.export /tmp/cas-sitio
+    python -m http.server --directory /tmp/cas-sitio
+
+El sitio incluye las tarjetas del inventario con sus filtros (el índice viaja
+embebido y se filtra en el navegador), las cinco redes como imagen estática y
+como página interactiva con el vis-network vendorizado (``lib/vis-9.1.2``),
+las tablas de interpretación, los paneles de capacidad de todas las
+organizaciones y escenarios, y las páginas reducidas del brief. Lo que
+necesita el servidor (consultas entre cultivos, expandir grupos de una red
+grande) queda solo en la app. Usa los artefactos precalculados
+(``cas.precompute``) si existen.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import unicodedata
+
+from cas.artifacts import STORE
+from cas.capacity import CAPACITY_STYLES, get_capacity, organization_sections
+from cas.data import DATA_DIR
+from cas.images import BRIEF_PAGES, image_bytes
+from cas.inventory import ALL_CROPS, PAGE_SIZE, get_inventory_index
+from cas.metrics import interpretation_table
+from cas.networks import NETWORKS
+from cas.render import network_payload, render_network_static
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib")
+LOGO = "data/cas.png"
+# Archivo que marca un directorio como exportación (se puede reemplazar sin preguntar)
+MARKER = ".cas-export"
+
+SITE_TITLE = "Construcción: Estrategia escalonamiento"
+AUTHORS = ("Authors: Alejandro Taborda, (latabordaa@unal.edu.co), Jeimar Tapasco, Armando Muñoz, "
+           "Luisa Perez, Deissy Martinez")
+
+ACTIVE = ' class="active"'
+
+# Vistas del sitio: (archivo, título del menú)
+PAGES = [
+    ("capacidad.html", "Capacidad de Modelos de extensión"),
+    ("inventario.html", "Inventario"),
+    ("redes/index.html", "Análisis de red por cultivos"),
+    ("brief.html", "Brief: Caracterización ME"),
+]
+
+
+def slug(text):
+    """``"Caña de azucar"`` -> ``"cana-de-azucar"``."""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_text.lower()).strip("-")
+
+
+def script_json(value):
+    # JSON seguro dentro de <script>: "</" no puede cerrar la etiqueta
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+
+
+class Site:
+    """Directorio de salida con las rutas y tamaños de lo escrito."""
+
+    def __init__(self, root):
+        self.root = root
+        self.files = {}
+
+    def write(self, path, content):
+        target = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with open(target, "wb") as f:
+            f.write(data)
+        self.files[path] = len(data)
+
+    def copy(self, source, path):
+        with open(source, "rb") as f:
+            self.write(path, f.read())
+
+    def page(self, path, title, body, head=""):
+        """Documento HTML con el menú de vistas, el encabezado y el pie de la app."""
+        prefix = "../" * path.count("/")
+        section = path.split("/")[0]
+        nav = "".join(
+            f'<a href="{prefix}{target}"{ACTIVE if target.split("/")[0] == section else ""}>{html.escape(label)}</a>'
+            for target, label in PAGES)
+        self.write(path, f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)} · Scaling CAS</title>
+<link rel="stylesheet" href="{prefix}assets/site.css">
+{head}
+</head>
+<body>
+<nav class="site"><a href="{prefix}index.html">Scaling CAS</a>{nav}</nav>
+<main>
+<h1>{html.escape(SITE_TITLE)}</h1>
+<hr>
+{body}
+</main>
+<footer>
+<hr>
+<p><em>Copyright (C) 2025. Alliance CIAT Bioversity</em></p>
+<p class="caption"><strong>{html.escape(AUTHORS)}</strong></p>
+<img src="{prefix}assets/cas.png" alt="CAS">
+</footer>
+<script src="{prefix}assets/site.js"></script>
+</body>
+</html>
+""")
+
+
+def tab_bar(group, options, active):
+    buttons = "".join(f'<button type="button" data-tab="{group}-{slug(option)}">{html.escape(option)}</button>'
+                      for option in options)
+    return f'<div class="tabs" data-group="{group}" data-active="{group}-{slug(active)}">{buttons}</div>'
+
+
+def tab_panel(group, option, body):
+    return f'<section class="tab-panel" data-group="{group}" id="{group}-{slug(option)}">{body}</section>'
+
+
+def export_inventory(site):
+    index = get_inventory_index()
+    data = {
+        "cards": index.cards.tolist(),
+        "index": {c: {r: {crop: index.rows(c, r, crop).tolist() for crop in index.cultivos(c, r)}
+                      for r in index.resultados(c)}
+                  for c in index.componentes},
+        "pageSize": PAGE_SIZE,
+        "allCrops": ALL_CROPS,
+    }
+    body = f"""<h2>Inventario de entregables proyecto CAS</h2>
+<div class="filters">
+<label>Selecciona un Componente<select id="f-componente"></select></label>
+<label>Selecciona un Resultado<select id="f-resultado"></select></label>
+<label>Selecciona un Cultivo<select id="f-cultivo"></select></label>
+</div>
+<div id="inventory">
+<h3 id="inventory-title"></h3>
+<div id="inventory-cards"></div>
+<p class="caption" id="inventory-caption"></p>
+<button type="button" class="more" id="inventory-more" hidden>Cargar más productos</button>
+</div>
+<script>window.CAS_INVENTORY = {script_json(data)};</script>"""
+    site.page("inventario.html", "Inventario", body)
+
+
+NETWORK_SCRIPT = """<script>
+(function () {
+  var payload = %s;
+  var data = { nodes: new vis.DataSet(payload.nodes), edges: new vis.DataSet(payload.edges) };
+  new vis.Network(document.getElementById("mynetwork"), data, payload.options || {});
+})();
+</script>"""
+
+
+def export_networks(site):
+    tabs = "".join(f'<a href="{slug(key)}.html">{html.escape(key)}</a>' for key in NETWORKS)
+    vis = ('<link rel="stylesheet" href="../assets/vis-9.1.2/vis-network.css">'
+           '<script src="../assets/vis-9.1.2/vis-network.min.js"></script>')
+    for key, spec in NETWORKS.items():
+        name = slug(key)
+        site.write(f"redes/{name}.png", render_network_static(key, spec.static_title))
+        table = interpretation_table(key).to_html(index=False)
+        nav = tabs.replace(f'href="{name}.html"', f'href="{name}.html" class="active"')
+        body = f"""<h2>Análisis de Red por Cultivos</h2>
+<div class="tabs">{nav}</div>
+<h3>{html.escape(spec.interactive_title)}</h3>
+<div id="mynetwork"></div>
+<h3>{html.escape(spec.static_title)}</h3>
+<img class="network" src="{name}.png" alt="{html.escape(spec.static_title)}">
+<h3>Interpretación del Análisis de Red ({html.escape(spec.label)})</h3>
+{table}
+{NETWORK_SCRIPT % script_json(network_payload(key))}"""
+        site.page(f"redes/{name}.html", key, body, head=vis)
+    # La entrada de la vista abre la primera red, como la pestaña por defecto de la app
+    first = slug(next(iter(NETWORKS)))
+    site.write("redes/index.html", f'<!DOCTYPE html><meta charset="utf-8">'
+                                   f'<meta http-equiv="refresh" content="0; url={first}.html">'
+                                   f'<a href="{first}.html">{html.escape(next(iter(NETWORKS)))}</a>')
+
+
+def sections_html(sections):
+    parts = []
+    for heading, columns, spaced in sections:
+        if spaced:
+            parts.append("<br>")
+        if heading:
+            parts.append(f"<h3>{html.escape(heading)}</h3>")
+        cells = "".join(f"<div>{column}</div>" for column in columns)
+        parts.append(f'<div class="columns" style="grid-template-columns: repeat({len(columns)}, 1fr);">'
+                     f"{cells}</div>")
+    return "\n".join(parts)
+
+
+def export_capacity(site):
+    capacity = get_capacity()
+    panels = []
+    for tab in capacity.tabs:
+        org = capacity.organization(tab)
+        scenarios = capacity.scenarios(org["Organización"]) if org is not None else []
+        if not scenarios:
+            panels.append(tab_panel("capacidad", tab, f"<p>🔨 En construcción para {html.escape(tab)}</p>"))
+            continue
+        group = slug(tab)
+        blocks = [f'<div data-scenario-of="{group}" data-scenario="{html.escape(scenario)}">'
+                  f"{sections_html(organization_sections(capacity, org, scenario))}</div>"
+                  for scenario in scenarios]
+        select = ""
+        if len(scenarios) > 1:
+            options = "".join(f"<option>{html.escape(scenario)}</option>" for scenario in scenarios)
+            select = f'<div class="filters"><label>Escenario<select data-scenarios="{group}">{options}</select></label></div>'
+        panels.append(tab_panel("capacidad", tab, select + "\n".join(blocks)))
+    body = (f"<h2>Capacidad de Modelos de extensión</h2>\n{''.join(CAPACITY_STYLES)}\n"
+            f"{tab_bar('capacidad', capacity.tabs, 'Banano/ASBAMA')}\n" + "\n".join(panels))
+    site.page("capacidad.html", "Capacidad de Modelos de extensión", body)
+
+
+def export_brief(site):
+    panels = []
+    for tab, paths in BRIEF_PAGES.items():
+        pages = []
+        for path in paths:
+            name = f"brief/{os.path.splitext(os.path.basename(path))[0]}.jpg"
+            site.write(name, image_bytes(path))
+            pages.append(name)
+        pager = ('<div class="pager"><button type="button" data-step="-1">⬅ Página anterior</button>'
+                 '<button type="button" data-step="1">Página siguiente ➡</button></div>')
+        panels.append(tab_panel("brief", tab, f"""<div class="carousel" data-title="{html.escape(tab)}" data-pages="{html.escape(json.dumps(pages))}">
+{pager}
+<figure class="page"><img alt="{html.escape(tab)}"><figcaption></figcaption></figure>
+{pager}
+</div>"""))
+    body = (f"<h2>Caracterización de modelos de extensión</h2>\n"
+            f"{tab_bar('brief', list(BRIEF_PAGES), 'Caña de azucar')}\n" + "\n".join(panels))
+    site.page("brief.html", "Brief: Caracterización ME", body)
+
+
+def export_index(site):
+    items = "".join(f'<li><a href="{target}">{html.escape(label)}</a></li>' for target, label in PAGES)
+    networks = "".join(f'<li><a href="redes/{slug(key)}.html">{html.escape(key)}</a></li>' for key in NETWORKS)
+    site.page("index.html", "Inicio", f"<h2>Vistas</h2><ul>{items}</ul><h3>Redes por cultivo</h3><ul>{networks}</ul>")
+
+
+def export(out_dir):
+    """Escribe el sitio completo en ``out_dir`` (reemplazándolo); devuelve ``{ruta: bytes}``."""
+    out_dir = os.path.abspath(out_dir)
+    if out_dir == os.path.abspath(DATA_DIR):
+        raise ValueError("El directorio de salida no puede ser el de los datos")
+    if os.path.isdir(out_dir) and os.listdir(out_dir) and not os.path.exists(os.path.join(out_dir, MARKER)):
+        raise ValueError(f"{out_dir} no está vacío y no es una exportación anterior")
+
+    # Sin hilo vigía: el proceso termina al escribir
+    STORE.interval = 0
+    from cas.precompute import load_artifacts
+    load_artifacts()
+
+    # Se escribe completo en una carpeta temporal y se publica al final
+    tmp = f"{out_dir}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    site = Site(tmp)
+    site.copy(os.path.join(LIB_DIR, "site", "site.css"), "assets/site.css")
+    site.copy(os.path.join(LIB_DIR, "site", "site.js"), "assets/site.js")
+    for name in os.listdir(os.path.join(LIB_DIR, "vis-9.1.2")):
+        site.copy(os.path.join(LIB_DIR, "vis-9.1.2", name), f"assets/vis-9.1.2/{name}")
+    site.copy(LOGO, "assets/cas.png")
+
+    export_index(site)
+    export_capacity(site)
+    export_inventory(site)
+    export_networks(site)
+    export_brief(site)
+    site.write(MARKER, "")
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp, out_dir)
+    return site.files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directorio del sitio (se reemplaza si es una exportación anterior)")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    files = export(args.out_dir)
+    print(f"{len(files)} archivos ({sum(files.values()) / 2**20:.1f} MB) en {args.out_dir} "
+          f"({time.perf_counter() - start:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
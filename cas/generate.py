@@ -0,0 +1,115 @@
+"""Generador de datos sintéticos con los esquemas de ``data/``.
+
+Escribe un directorio de datos completo (inventario, los CSV de aristas de
+todas las redes registradas y los archivos que no se generan, copiados de la
+fuente) con el tamaño pedido. Las filas se generan una a una con un
+``random.Random`` sembrado y se escriben directo a disco, de modo que la
+memoria no crece con el tamaño del conjunto y la misma semilla produce
+siempre los mismos archivos::
+
+    python -m cas.generate /tmp/cas-grande --inventory-rows 50000 --edges 50000 --seed 7
+    CAS_DATA_DIR=/tmp/cas-grande streamlit run inventario.py
+"""
+import argparse
+import csv
+import os
+import random
+import shutil
+import sys
+
+from cas.data import DATA_DIR, INVENTORY_CSV, load_inventory
+from cas.inventory import crop_tokens
+from cas.networks import NETWORKS
+
+INVENTORY_COLUMNS = ["Componente", "Resultado", "Producto N°", "Descripción", "Cultivos Asociados",
+                     "Avance Identificado", "Estado", "Evidencia"]
+EDGE_HEADER = ["Origen", "Destino", "Tipo de Interacción", "Periodicidad de la Interacción"]
+
+# Relaciones típicas entre tipos de actor: (origen, destino, interacciones, peso relativo).
+# Los nombres usan las subcadenas de ``cas.graphs.ACTOR_TYPES``.
+RELATIONS = [
+    ("Asistentes técnicos {org}", "Productores de {crop} {org}", ("Visitas fincas", "Asistencia técnica"), 6),
+    ("Extensionistas {org}", "Productores de {crop} {org}", ("Escuelas de campo", "Días de campo"), 4),
+    ("Investigadores {org}", "Asistentes técnicos {org}", ("Transferencia de tecnología",), 2),
+    ("Dirección técnica {org}", "Asistentes técnicos {org}", ("Capacitación", "Supervisión"), 2),
+    ("Servicio agroclimático {org}", "Productores de {crop} {org}", ("Boletines agroclimáticos",), 1),
+    ("Gremio {crop}", "Dirección técnica {org}", ("Coordinación", "Financiación"), 1),
+]
+
+# Actores distintos aproximados por arista generada
+ORGS_PER_EDGE = 0.1
+
+
+def inventory_rows(n_rows, rng, source):
+    """Filas del inventario con el vocabulario (componentes, resultados, textos) de ``source``."""
+    results = source.groupby("Componente", sort=False)["Resultado"].unique()
+    crops = sorted({token.capitalize() for cell in source["Cultivos Asociados"] for token in crop_tokens(cell)})
+    texts = {col: source[col].dropna().unique().tolist()
+             for col in ("Descripción", "Avance Identificado", "Estado", "Evidencia")}
+    for i in range(n_rows):
+        componente = rng.choice(results.index)
+        resultado = rng.choice(list(results[componente]))
+        cultivos = ", ".join(rng.sample(crops, rng.randint(1, min(6, len(crops)))))
+        yield [componente, resultado, str(i + 1), f"{rng.choice(texts['Descripción'])} (#{i + 1})",
+               cultivos, rng.choice(texts["Avance Identificado"]), rng.choice(texts["Estado"]),
+               rng.choice(texts["Evidencia"])]
+
+
+def edge_rows(n_edges, rng, crop, label):
+    """Aristas de una red de extensión con nombres de actor por tipo y organización."""
+    n_orgs = max(1, int(n_edges * ORGS_PER_EDGE))
+    weights = [weight for *_, weight in RELATIONS]
+    for _ in range(n_edges):
+        origin, target, interactions, _ = rng.choices(RELATIONS, weights)[0]
+        org = f"{label} {rng.randrange(n_orgs) + 1}"
+        yield [origin.format(org=org, crop=crop), target.format(org=org, crop=crop),
+               rng.choice(interactions), rng.randint(1, 10)]
+
+
+def write_csv(path, header, rows):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def generate(out_dir, inventory_rows_count, edges_count, seed=42, source_dir=DATA_DIR):
+    """Escribe un conjunto de datos en ``out_dir``; devuelve las rutas generadas."""
+    if os.path.abspath(out_dir) == os.path.abspath(source_dir):
+        raise ValueError("El directorio de salida no puede ser el de los datos fuente")
+    rng = random.Random(seed)
+    written = []
+
+    # Archivos que no se generan (interpretaciones, capacidad): copia de la fuente
+    shutil.copytree(source_dir, out_dir, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns(".cache", "*.jpg", "*.png"))
+
+    source = load_inventory(os.path.join(source_dir, os.path.relpath(INVENTORY_CSV, DATA_DIR)))
+    path = os.path.join(out_dir, os.path.relpath(INVENTORY_CSV, DATA_DIR))
+    write_csv(path, INVENTORY_COLUMNS, inventory_rows(inventory_rows_count, rng, source))
+    written.append(path)
+
+    for spec in NETWORKS.values():
+        crop = spec.key.split("/")[0].lower()
+        path = os.path.join(out_dir, os.path.relpath(spec.edges, DATA_DIR))
+        write_csv(path, EDGE_HEADER, edge_rows(edges_count, rng, crop, spec.label))
+        written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directorio de salida (se usa luego como CAS_DATA_DIR)")
+    parser.add_argument("--inventory-rows", type=int, default=10000, help="filas del inventario")
+    parser.add_argument("--edges", type=int, default=10000, help="aristas por red")
+    parser.add_argument("--seed", type=int, default=42, help="semilla del generador")
+    parser.add_argument("--source", default=DATA_DIR, help="datos de los que se toma el vocabulario")
+    args = parser.parse_args(argv)
+    for path in generate(args.out_dir, args.inventory_rows, args.edges, args.seed, args.source):
+        print(f"{path}: {os.path.getsize(path) / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Registro de grafos compartido por todas las sesiones del proceso.
+
+Cada red se construye una sola vez por versión de su CSV de aristas (el
+almacén de artefactos la reconstruye cuando el CSV cambia). La forma base es
+``CompactGraph``: nodos internados, aristas en arreglos NumPy, tipo de actor,
+grado y etiquetas ya calculados, suficiente para las métricas y los payloads.
+El ``nx.DiGraph`` se construye a partir de ella solo cuando un algoritmo lo
+necesita (layout, dibujo) y se entrega congelado (``nx.freeze``): las sesiones
+pueden leerlo pero cualquier intento de modificarlo falla.
+"""
+import os
+import re
+import textwrap
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cas.artifacts import STORE
+from cas.data import load_network_edges
+from cas.edges import collapse_edges, load_edge_table
+from cas.networks import NETWORKS
+
+# Clasificación de actores por subcadena del nombre, en orden de prioridad
+ACTOR_TYPES = [
+    ("Productores", ("Productores",)),
+    ("Asistentes", ("Asistentes", "Extensionistas")),
+    ("Investigadores", ("Investigadores",)),
+    ("CENIBANANO", ("CENIBANANO",)),
+    ("Servicio", ("Servicio",)),
+]
+OTHER_ACTOR_TYPE = "Otros"
+
+# Ancho (caracteres) de las etiquetas de nodo de la figura estática
+LABEL_WIDTH = 20
+
+# Desde este tamaño el CSV de aristas se lee por bloques (``cas.edges``)
+STREAMING_MIN_BYTES = int(os.environ.get("CAS_STREAMING_MIN_BYTES", 32 * 1024 * 1024))
+
+
+def actor_type_codes(names):
+    """Código (posición en ``ACTOR_TYPE_NAMES``) del tipo de cada nombre, vectorizado."""
+    names = pd.Series(names, dtype=object)
+    conditions = [names.str.contains("|".join(map(re.escape, patterns))).to_numpy(dtype=bool)
+                  for _, patterns in ACTOR_TYPES]
+    # ``np.select`` toma la primera condición verdadera: mismo orden de prioridad
+    return np.select(conditions, np.arange(len(ACTOR_TYPES)), default=len(ACTOR_TYPES)).astype(np.int8)
+
+
+def wrap_labels(names, width=LABEL_WIDTH):
+    return np.array(["\n".join(textwrap.wrap(name, width)) for name in names], dtype=object)
+
+
+class CompactGraph:
+    """Red dirigida en arreglos: nodos internados y aristas en CSR.
+
+    ``names[src[i]] -> names[dst[i]]`` es la arista ``i`` (peso ``weight[i]``,
+    tipo de interacción ``labels[i]``). Nodos y aristas siguen el orden de
+    ``nx.DiGraph`` (nodos por aparición, aristas por origen), de modo que los
+    arreglos se alinean con ``G.nodes()`` y ``G.edges()`` del grafo de
+    ``to_networkx``. Como las aristas están agrupadas por origen,
+    ``dst[indptr[u]:indptr[u + 1]]`` son los vecinos salientes de ``u`` (CSR).
+    El tipo de actor, el grado ponderado y las etiquetas partidas en líneas se
+    calculan una vez al construirla.
+    """
+
+    def __init__(self, names, src, dst, weight, labels):
+        self.names = names
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.labels = labels
+        n = len(names)
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.type_codes = actor_type_codes(names)
+        self.degree = (np.bincount(src, weights=weight, minlength=n)
+                       + np.bincount(dst, weights=weight, minlength=n))
+        if np.issubdtype(weight.dtype, np.integer):
+            self.degree = self.degree.astype(np.int64)
+        self.connections = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+        self._wrapped = {LABEL_WIDTH: wrap_labels(names)}
+
+    @classmethod
+    def from_frame(cls, df_net):
+        """Desde las columnas normalizadas de ``cas.data`` (una arista repetida conserva su última fila)."""
+        origin = df_net["Origen"].to_numpy(dtype=object)
+        target = df_net["Destino"].to_numpy(dtype=object)
+        codes, names = pd.factorize(np.column_stack([origin, target]).ravel())
+        src, dst = codes[0::2], codes[1::2]
+        # Cada par queda en la posición de su primera fila con los atributos de la última
+        pair_codes, pairs = pd.factorize(src.astype(np.int64) << 32 | dst)
+        rows = np.zeros(len(pairs), dtype=np.int64)
+        np.maximum.at(rows, pair_codes, np.arange(len(pair_codes)))
+        # Aristas agrupadas por origen, como las recorre ``nx.DiGraph``
+        order = np.argsort(pairs >> 32, kind="stable")
+        pairs, rows = pairs[order], rows[order]
+        return cls(
+            names=np.asarray(names, dtype=object),
+            src=(pairs >> 32).astype(np.int32),
+            dst=(pairs & 0xFFFFFFFF).astype(np.int32),
+            # Se conserva el tipo (entero si no hay pesos vacíos) como en el CSV
+            weight=df_net["Peso"].to_numpy()[rows],
+            labels=df_net["Tipo de Interacción"].to_numpy(dtype=object)[rows],
+        )
+
+    @classmethod
+    def from_edge_table(cls, table):
+        """Desde un ``cas.edges.EdgeTable``, reutilizando sus ids internados (aristas ya únicas)."""
+        # Los ids ya siguen el orden de aparición; solo falta agrupar las aristas por origen
+        order = np.argsort(table.src, kind="stable")
+        return cls(
+            names=table.names,
+            src=table.src[order],
+            dst=table.dst[order],
+            weight=table.weight.astype(np.float64)[order],
+            labels=table.joined_labels()[order],
+        )
+
+    @property
+    def n_nodes(self):
+        return len(self.names)
+
+    @property
+    def n_edges(self):
+        return len(self.src)
+
+    @property
+    def actor_types(self):
+        return ACTOR_TYPE_ARRAY[self.type_codes]
+
+    def wrapped_labels(self, width=LABEL_WIDTH):
+        """Nombres partidos en líneas de ``width`` caracteres (calculados una vez por ancho)."""
+        if width not in self._wrapped:
+            self._wrapped[width] = wrap_labels(self.names, width)
+        return self._wrapped[width]
+
+    def to_networkx(self):
+        """``nx.DiGraph`` congelado, para los algoritmos y el dibujo que lo necesitan."""
+        G = nx.DiGraph()
+        G.add_nodes_from(
+            (name, {"degree": degree, "actor_type": t})
+            for name, degree, t in zip(self.names.tolist(), self.degree.tolist(), self.actor_types.tolist())
+        )
+        G.add_edges_from(
+            (u, v, {"weight": w, "label": label})
+            for u, v, w, label in zip(self.names[self.src].tolist(), self.names[self.dst].tolist(),
+                                      self.weight.tolist(), self.labels.tolist())
+        )
+        return nx.freeze(G)
+
+
+ACTOR_TYPE_NAMES = [name for name, _ in ACTOR_TYPES] + [OTHER_ACTOR_TYPE]
+ACTOR_TYPE_ARRAY = np.array(ACTOR_TYPE_NAMES, dtype=object)
+
+
+def get_graph(key):
+    """Grafo (de solo lectura) de la red registrada como ``key``."""
+    spec = NETWORKS[key]
+    return get_graph_from_csv(spec.edges, spec.duplicates)
+
+
+def get_compact(key):
+    """``CompactGraph`` de la red registrada como ``key``."""
+    spec = NETWORKS[key]
+    return get_compact_from_csv(spec.edges, spec.duplicates)
+
+
+def get_graph_from_csv(path, how="last"):
+    return STORE.get(("graph", path, how), lambda: get_compact_from_csv(path, how).to_networkx())
+
+
+def get_compact_from_csv(path, how="last"):
+    """``CompactGraph`` del CSV ``path`` con las aristas repetidas agregadas según ``how``."""
+    return STORE.get(("compact", path, how), lambda: _build_compact(path, how))
+
+
+def _build_compact(path, how):
+    # Los registros grandes se agregan por bloques y los pequeños en memoria, con
+    # la misma regla para las aristas repetidas (``cas.edges``)
+    if os.path.getsize(path) >= STREAMING_MIN_BYTES:
+        return CompactGraph.from_edge_table(load_edge_table(path, how))
+    return CompactGraph.from_frame(collapse_edges(load_network_edges(path), how))
@@ -0,0 +1,120 @@
+"""Servicio de imágenes del carrusel "Brief: Caracterización ME".
+
+Las páginas originales (JPEG de 150-500 KB a ~1400 px de ancho) se reducen una
+vez al ancho en que se muestran y los bytes codificados se guardan en un LRU
+acotado por tamaño, de modo que pasar de página no lee disco ni redimensiona.
+``prefetch`` prepara en segundo plano las páginas vecinas.
+
+El carrusel usa JPEG porque ``st.image`` vuelve a codificar cualquier otro
+formato (p. ej. WebP) a JPEG/PNG; WebP queda disponible para otros consumidores.
+"""
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from cas import profiling
+from cas.artifacts import STORE
+from cas.data import file_version
+
+# Ancho con que el carrusel muestra las páginas (st.image(..., width=700))
+BRIEF_WIDTH = 700
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+# Páginas de cada pestaña del carrusel
+BRIEF_PAGES = {
+    'Caña de azucar': [f"data/CanaAzucar{i}.jpg" for i in range(1, 7)],
+    'Café': [f"data/Cafe{i}.jpg" for i in range(1, 8)],
+    'Banano': [f"data/banano{i}.jpg" for i in range(1, 7)],
+    'Arroz': [f"data/Arroz{i}.jpg" for i in range(1, 6)],
+}
+
+# Límite de memoria para los bytes codificados en caché
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ByteLRU:
+    """LRU de valores ``bytes`` acotado por la suma de sus tamaños."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+_cache = ByteLRU(CACHE_MAX_BYTES)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cas-images")
+
+
+def encode_image(path, width=BRIEF_WIDTH, fmt="JPEG"):
+    """Derivado de ``path`` reducido a ``width`` px de ancho, codificado en ``fmt``."""
+    with Image.open(path) as im:
+        im = im.convert("RGB")
+        if im.width > width:
+            im = im.resize((width, round(im.height * width / im.width)), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        if fmt == "WEBP":
+            im.save(buf, format="WEBP", quality=WEBP_QUALITY, method=4)
+        else:
+            im.save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def image_bytes(path, width=BRIEF_WIDTH, fmt="JPEG"):
+    """Bytes del derivado (desde caché si ya existe para esta versión del archivo)."""
+    key = (path, file_version(path), width, fmt)
+    data = _cache.get(key)
+    profiling.count("imágenes", "miss" if data is None else "hit")
+    if data is None:
+        # Derivado precalculado en el despliegue (``cas.precompute``), si lo hay
+        persisted = STORE.load_persisted(("image", path, width, fmt))
+        if persisted is not None and persisted[1].get(path) == key[1]:
+            data = persisted[0]
+        else:
+            with profiling.stage("codificar imagen"):
+                data = encode_image(path, width, fmt)
+        _cache.put(key, data)
+    return data
+
+
+def prefetch(paths, width=BRIEF_WIDTH, fmt="JPEG"):
+    """Prepara en segundo plano los derivados de ``paths`` que aún no están en caché."""
+    for path in paths:
+        _executor.submit(_prefetch_one, path, width, fmt)
+
+
+def _prefetch_one(path, width, fmt):
+    try:
+        image_bytes(path, width, fmt)
+    except OSError:
+        # Una página faltante se reporta cuando se muestre, no al precargarla
+        pass
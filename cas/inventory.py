@@ -0,0 +1,83 @@
+"""Índice invertido del inventario para los filtros de la vista "Inventario".
+
+Se construye una vez por versión de ``Inventary2.csv``: los cultivos de cada
+producto se normalizan en tokens y cada combinación (Componente, Resultado,
+cultivo) apunta a sus posiciones de fila, de modo que cambiar un filtro es una
+búsqueda en diccionario. Los cultivos se comparan por token completo, no por
+subcadena.
+
+El HTML de las tarjetas de producto también se arma una sola vez, en una
+pasada vectorizada, y la vista lo emite por páginas (un elemento por página).
+"""
+import numpy as np
+
+from cas.artifacts import STORE
+from cas.data import INVENTORY_CSV, load_inventory
+
+# Opción del selector que desactiva el filtro por cultivo
+ALL_CROPS = "todos"
+
+# Productos por página en la vista de inventario
+PAGE_SIZE = 20
+
+
+def crop_tokens(cell):
+    """Cultivos normalizados de una celda de "Cultivos Asociados"."""
+    return [token.strip().lower() for token in cell.split(",") if token.strip()]
+
+
+def card_html(df):
+    """HTML de una tarjeta ``.product-card`` por fila, en una sola pasada."""
+    def text(col):
+        # Sin saltos de línea: una línea en blanco cortaría el bloque HTML del markdown
+        return df[col].astype(str).str.replace(r"\s*\n\s*", " ", regex=True)
+
+    return ('<div class="product-card">'
+            '<h3 style="margin-bottom: 8px;">Producto N° ' + text("Producto N°") + '</h3>'
+            '<p style="margin: 4px 0;"><strong>Descripción:</strong> ' + text("Descripción") + '</p>'
+            '<p style="margin: 4px 0;"><strong>Cultivos Asociados:</strong> ' + text("Cultivos Asociados") + '</p>'
+            '<p style="margin: 4px 0;"><strong>Avance Identificado:</strong> ' + text("Avance Identificado") + '</p>'
+            '<p style="margin: 4px 0;"><strong>Estado:</strong> ' + text("Estado") + '</p>'
+            '</div>').to_numpy()
+
+
+class InventoryIndex:
+    def __init__(self, df):
+        self.df = df
+        self.cards = card_html(df)
+        self.crops = [frozenset(crop_tokens(cell)) for cell in df["Cultivos Asociados"]]
+        groups = {}
+        for pos, (componente, resultado, crops) in enumerate(zip(df["Componente"], df["Resultado"], self.crops)):
+            groups.setdefault((componente, resultado, ALL_CROPS), []).append(pos)
+            for crop in crops:
+                if crop != ALL_CROPS:
+                    groups.setdefault((componente, resultado, crop), []).append(pos)
+        self._rows = {key: np.array(rows, dtype=np.intp) for key, rows in groups.items()}
+
+        self.componentes = sorted({c for c, _, _ in self._rows})
+        self._resultados = {}
+        self._cultivos = {}
+        for componente, resultado, crop in self._rows:
+            self._resultados.setdefault(componente, set()).add(resultado)
+            self._cultivos.setdefault((componente, resultado), set()).add(crop)
+
+    def resultados(self, componente):
+        return sorted(self._resultados.get(componente, ()))
+
+    def cultivos(self, componente, resultado):
+        """Opciones de cultivo (incluye ``"todos"``) del Componente y Resultado dados."""
+        return sorted(self._cultivos.get((componente, resultado), {ALL_CROPS}))
+
+    def rows(self, componente, resultado, cultivo=ALL_CROPS):
+        return self._rows.get((componente, resultado, cultivo), np.empty(0, dtype=np.intp))
+
+    def filter(self, componente, resultado, cultivo=ALL_CROPS):
+        return self.df.iloc[self.rows(componente, resultado, cultivo)]
+
+    def page_html(self, rows, page, page_size=PAGE_SIZE):
+        """HTML de las tarjetas de la página ``page`` (desde 0) de ``rows``."""
+        return "\n".join(self.cards[rows[page * page_size:(page + 1) * page_size]])
+
+
+def get_inventory_index(path=INVENTORY_CSV):
+    return STORE.get(("inventory_index", path), lambda: InventoryIndex(load_inventory(path)))
@@ -0,0 +1,111 @@
+"""Modo de red grande para la vista interactiva.
+
+Cuando una red supera ``LARGE_GRAPH_NODES`` nodos, el navegador no recibe el
+grafo completo: los actores se agregan por tipo (la misma clasificación de
+colores de la vista estática), las posiciones se calculan en el servidor con
+la física desactivada y un clic sobre un grupo lo expande (nivel de detalle)
+mostrando sus actores de mayor grado. El tamaño del payload queda acotado por
+el número de grupos expandidos, no por el tamaño de la red.
+"""
+import math
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cas.graphs import ACTOR_TYPES, OTHER_ACTOR_TYPE
+from cas.layouts import spring_layout
+
+# Umbral a partir del cual se agrega la red por tipo de actor
+LARGE_GRAPH_NODES = 500
+# Actores visibles por grupo expandido y aristas máximas en el payload
+MAX_EXPANDED_NODES = 150
+MAX_EDGES = 3000
+
+CLUSTER_PREFIX = "cluster:"
+LAYOUT_SCALE = 800.0
+MEMBER_SPACING = 18.0
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+LARGE_GRAPH_OPTIONS = {
+    "physics": {"enabled": False},
+    "interaction": {"hideEdgesOnDrag": True, "tooltipDelay": 100},
+    "edges": {"smooth": False},
+}
+
+
+def cluster_id(actor_type):
+    return CLUSTER_PREFIX + actor_type
+
+
+def is_large(graph):
+    return graph.n_nodes > LARGE_GRAPH_NODES
+
+
+def aggregated_payload(graph, colors, default_color, expanded=frozenset()):
+    """Nodos y aristas (de un ``CompactGraph``) agregados por tipo de actor, con ``expanded`` desplegados."""
+    nodes = pd.DataFrame({"name": graph.names, "type": graph.actor_types, "degree": graph.degree})
+    edges = pd.DataFrame({"u": graph.names[graph.src], "v": graph.names[graph.dst], "weight": graph.weight,
+                          "label": graph.labels})
+
+    # Unidad visible de cada nodo: él mismo si su grupo está expandido y está entre los
+    # de mayor grado; si no, el nodo del grupo
+    nodes["rank"] = nodes.groupby("type")["degree"].rank(method="first", ascending=False)
+    visible = nodes["type"].map(lambda t: cluster_id(t) in expanded) & (nodes["rank"] <= MAX_EXPANDED_NODES)
+    nodes["unit"] = np.where(visible, nodes["name"], CLUSTER_PREFIX + nodes["type"])
+    unit_of = dict(zip(nodes["name"], nodes["unit"]))
+
+    # Aristas entre unidades visibles (las internas a un grupo desaparecen)
+    edges["from"] = edges["u"].map(unit_of)
+    edges["to"] = edges["v"].map(unit_of)
+    edges = edges[edges["from"] != edges["to"]]
+    grouped = (edges.groupby(["from", "to"], sort=False)
+               .agg(value=("weight", "sum"), count=("weight", "size"), label=("label", "first"))
+               .reset_index()
+               .nlargest(MAX_EDGES, "value"))
+
+    # Posiciones: layout del grafo de grupos y espiral de actores alrededor de su grupo
+    types = [t for t, _ in ACTOR_TYPES if (nodes["type"] == t).any()]
+    if (nodes["type"] == OTHER_ACTOR_TYPE).any():
+        types.append(OTHER_ACTOR_TYPE)
+    cluster_graph = nx.DiGraph()
+    cluster_graph.add_nodes_from(types)
+    type_of = dict(zip(nodes["name"], nodes["type"]))
+    for (a, b), weight in edges.groupby([edges["u"].map(type_of), edges["v"].map(type_of)])["weight"].sum().items():
+        if a != b:
+            cluster_graph.add_edge(a, b, weight=float(weight))
+    centers = spring_layout(nx.freeze(cluster_graph))
+
+    sizes = nodes["type"].value_counts()
+    payload_nodes = []
+    for t in types:
+        cx, cy = centers[t] * LAYOUT_SCALE
+        count = int(sizes[t])
+        members = nodes[(nodes["type"] == t) & (nodes["unit"] != cluster_id(t))].sort_values("rank")
+        hidden = count - len(members)
+        is_expanded = cluster_id(t) in expanded
+        # El nodo del grupo se mantiene al expandir: un clic sobre él lo vuelve a contraer
+        if not is_expanded:
+            label = f"{t} ({count:,})"
+        else:
+            label = f"{t} (+{hidden:,} más)" if hidden else t
+        payload_nodes.append({
+            "id": cluster_id(t), "label": label, "value": max(hidden, 1), "x": float(cx), "y": float(cy),
+            "shape": "dot", "color": colors.get(t, default_color), "font": {"color": "black"},
+            "title": f"{count:,} actores de tipo {t}. Clic para " + ("contraer" if is_expanded else "expandir"),
+        })
+        radius = MEMBER_SPACING * np.sqrt(np.arange(1, len(members) + 1) + 4)
+        angle = GOLDEN_ANGLE * np.arange(len(members))
+        for name, r, a in zip(members["name"], radius, angle):
+            payload_nodes.append({
+                "id": name, "label": name, "title": name, "x": float(cx + r * np.cos(a)),
+                "y": float(cy + r * np.sin(a)), "shape": "dot", "size": 8,
+                "color": colors.get(t, default_color), "font": {"color": "black"},
+            })
+
+    payload_edges = [
+        {"from": a, "to": b, "value": float(value),
+         "title": label if count == 1 else f"{count:,} interacciones"}
+        for a, b, value, count, label in grouped[["from", "to", "value", "count", "label"]].itertuples(index=False)
+    ]
+    return {"nodes": payload_nodes, "edges": payload_edges, "options": LARGE_GRAPH_OPTIONS}
@@ -0,0 +1,99 @@
+"""Caché de posiciones ``spring_layout`` en memoria y en disco.
+
+Las posiciones se identifican por un hash de la lista de nodos, las aristas
+(con su peso) y los parámetros del layout; como ``spring_layout`` es
+determinista con semilla fija, basta calcularlas una vez. El almacén en disco
+vive junto a los datos (``data/.cache/layouts``) y se puede calcular en el
+despliegue con::
+
+    python -m cas.layouts
+"""
+import hashlib
+import json
+import os
+import time
+import weakref
+
+import networkx as nx
+import numpy as np
+
+from cas import profiling
+from cas.data import DATA_DIR
+
+LAYOUT_DIR = os.path.join(DATA_DIR, ".cache", "layouts")
+
+# Parámetros del layout de la vista estática
+SPRING_PARAMS = {"seed": 42, "k": 1.5}
+
+
+def layout_key(G, **params):
+    h = hashlib.sha256()
+    h.update(json.dumps(["spring", nx.__version__, sorted(params.items())]).encode())
+    h.update(json.dumps(list(G.nodes()), ensure_ascii=False).encode())
+    h.update(json.dumps([[u, v, d.get("weight")] for u, v, d in G.edges(data=True)],
+                        ensure_ascii=False, default=float).encode())
+    return h.hexdigest()
+
+
+def spring_layout(G, **params):
+    """Posiciones ``{nodo: array([x, y])}`` de ``G``, calculadas una sola vez."""
+    params = {**SPRING_PARAMS, **params}
+    param_items = tuple(sorted(params.items()))
+    # El hash recorre todas las aristas: se recuerda por objeto grafo (congelado)
+    keys = _graph_keys.setdefault(G, {})
+    if param_items not in keys:
+        keys[param_items] = layout_key(G, **params)
+    key = keys[param_items]
+
+    coords = _positions.get(key)
+    profiling.count("layout", "miss" if coords is None else "hit")
+    if coords is None:
+        with profiling.stage("layout"):
+            coords = _positions[key] = _load_or_compute(key, G, params)
+    return {node: np.array(xy) for node, xy in coords.items()}
+
+
+_graph_keys = weakref.WeakKeyDictionary()
+_positions = {}
+
+
+def _load_or_compute(key, G, params):
+    path = os.path.join(LAYOUT_DIR, key + ".json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    pos = nx.spring_layout(G, **params)
+    coords = {node: [float(x), float(y)] for node, (x, y) in pos.items()}
+    _write_json(path, coords)
+    return coords
+
+
+def _write_json(path, payload):
+    # Escritura atómica: otras sesiones nunca leen un archivo a medio escribir
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        # Sin permisos de escritura el caché en memoria sigue funcionando
+        pass
+
+
+def warm_layouts():
+    from cas.graphs import get_graph
+    from cas.networks import NETWORKS
+
+    for key in NETWORKS:
+        start = time.perf_counter()
+        G = get_graph(key)
+        spring_layout(G)
+        print(f"{key}: {G.number_of_nodes()} nodos, {G.number_of_edges()} aristas "
+              f"({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    warm_layouts()
@@ -0,0 +1,456 @@
+"""Prueba de carga con sesiones simultáneas contra un servidor local.
+
+Lanza ``streamlit run inventario.py`` en un puerto local (o usa uno ya
+levantado con ``--url``) y abre N sesiones por WebSocket que hablan el mismo
+protocolo que el navegador: cada sesión recorre guiones de clics realistas
+(cambio de vista, pestañas ``ui.tabs``, filtros del inventario, "Cargar más",
+páginas del carrusel), cada cambio se envía como un rerun con el estado de sus
+widgets (de su fragmento, si lo tiene) y se cronometra hasta el fin del
+script. Las imágenes de cada rerun se descargan de ``/media`` como lo haría
+el navegador. Todo corre sin red externa::
+
+    python -m cas.loadtest --sessions 20 --iterations 3
+    python -m cas.loadtest --data-dir data
+    python -m cas.loadtest --url http://localhost:8501 --pid 1234
+
+El servidor lanzado usa por defecto un conjunto sintético pequeño y sembrado
+(``cas.generate``) con filtros del inventario de más de ``PAGE_SIZE``
+productos, para que "Cargar más" aparezca; con ``--data-dir data`` (ningún
+filtro de los datos incluidos llega a una segunda página) ese paso se cuenta
+como acción omitida.
+
+Informa p50/p95/p99 de la latencia de rerun (total y por acción), reruns por
+segundo, crecimiento del RSS del servidor (``/proc``, solo Linux), errores
+(excepciones en la página, tiempos agotados, medios que no se sirven) y
+corrupciones: las sesiones que recorren el mismo guion deben ver exactamente
+el mismo contenido en cada paso, de modo que una figura, HTML o tarjeta que
+difiere de la mayoría delata estado compartido entre sesiones.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import socket
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+from tornado.websocket import websocket_connect
+
+
+VIEW_LABEL = "Selecciona la vista:"
+SCRIPT = "inventario.py"
+# Tamaño del conjunto sintético del servidor lanzado (redes por debajo de ``LARGE_GRAPH_NODES``)
+FIXTURE_INVENTORY_ROWS = 300
+FIXTURE_EDGES = 300
+
+# Guiones de clics: (acción, widget, valor). El widget se busca por su ``key``
+# o, si no tiene, por su etiqueta; un valor entero es una posición en las opciones.
+SCENARIOS = {
+    "inventario": [
+        ("select", VIEW_LABEL, "Inventario"),
+        ("click", "inventory_load_more", None),
+        ("select", "Selecciona un Componente", 1),
+        ("select", "Selecciona un Resultado", 1),
+        ("select", "Selecciona un Cultivo", 1),
+        ("select", "Selecciona un Cultivo", 0),
+        ("select", "Selecciona un Componente", 0),
+    ],
+    "redes": [
+        ("select", VIEW_LABEL, "Análisis de red por cultivos"),
+        ("tabs", "network_tabs", "Banano/Augura"),
+        ("select", "network_viz", 0),
+        ("tabs", "network_tabs", "Café"),
+        ("select", "network_viz", 1),
+        ("tabs", "network_tabs", "Arroz"),
+    ],
+    "brief": [
+        ("select", VIEW_LABEL, "Brief: Caracterización ME"),
+        ("click", "brief_top_next", None),
+        ("click", "brief_bottom_next", None),
+        ("tabs", "brief_tabs", "Café"),
+        ("click", "brief_top_next", None),
+        ("click", "brief_bottom_prev", None),
+    ],
+    "capacidad": [
+        ("select", VIEW_LABEL, "Capacidad de Modelos de extensión"),
+        ("tabs", "capacity_tabs", "Banano/Augura"),
+        ("tabs", "capacity_tabs", "Café"),
+        ("tabs", "capacity_tabs", "Banano/ASBAMA"),
+    ],
+}
+
+WIDGET_TYPES = ("selectbox", "button", "component_instance", "number_input")
+# Elementos cuyo contenido depende del tiempo y no de los datos
+VOLATILE_TYPES = ("spinner", "empty")
+
+
+class SessionError(Exception):
+    pass
+
+
+class Session:
+    """Una sesión de navegador simulada sobre el WebSocket de Streamlit."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.http = AsyncHTTPClient()
+        self.ws = None
+        self.states = {}      # id de widget -> WidgetState enviado
+        self.widgets = {}     # ruta del elemento -> (id, tipo, widget, fragmento)
+        self.cache = {}       # hash -> ForwardMsg (mensajes que el servidor envía por referencia)
+
+    async def connect(self):
+        url = self.base_url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.ws = await websocket_connect(url, subprotocols=["streamlit"], max_message_size=1 << 30)
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(self, fragment_id=""):
+        """Envía un rerun con el estado de los widgets; devuelve ``(segundos, huella, errores)``."""
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        msg.rerun_script.fragment_id = fragment_id
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        elements, errors, media = {}, [], []
+        while True:
+            try:
+                raw = await asyncio.wait_for(self.ws.read_message(), self.timeout)
+            except asyncio.TimeoutError:
+                raise SessionError(f"sin respuesta en {self.timeout:.0f} s") from None
+            if raw is None:
+                raise SessionError("el servidor cerró la conexión")
+            fwd = await self._resolve(ForwardMsg.FromString(raw))
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                self._apply(fwd, elements, errors, media)
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    errors.append("error de compilación")
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+        seconds = time.perf_counter() - start
+
+        # Los triggers (botones) valen para un solo rerun
+        for wid in [wid for wid, state in self.states.items() if state.HasField("trigger_value")]:
+            del self.states[wid]
+        if not fragment_id:
+            # Un rerun completo redibuja toda la página: los widgets que no volvieron ya no existen
+            self.widgets = {path: item for path, item in self.widgets.items() if path in elements}
+            alive = {item[0] for item in self.widgets.values()}
+            self.states = {wid: state for wid, state in self.states.items() if wid in alive}
+        for url in media:
+            try:
+                await self.http.fetch(self.base_url + url)
+            except (HTTPClientError, OSError) as e:
+                errors.append(f"medio {url}: {e}")
+        return seconds, _fingerprint(elements), errors
+
+    async def _resolve(self, fwd):
+        # Mensajes repetidos llegan como referencia al hash de uno anterior
+        if fwd.WhichOneof("type") == "ref_hash":
+            cached = self.cache.get(fwd.ref_hash)
+            if cached is None:
+                response = await self.http.fetch(f"{self.base_url}/_stcore/message?hash={fwd.ref_hash}")
+                cached = ForwardMsg.FromString(response.body)
+            metadata = fwd.metadata
+            fwd = ForwardMsg()
+            fwd.CopyFrom(cached)
+            fwd.metadata.CopyFrom(metadata)
+        elif fwd.hash:
+            self.cache[fwd.hash] = fwd
+        return fwd
+
+    def _apply(self, fwd, elements, errors, media):
+        delta = fwd.delta
+        path = tuple(fwd.metadata.delta_path)
+        if delta.WhichOneof("type") == "add_block":
+            elements[path] = ("block", delta.add_block.SerializeToString(deterministic=True))
+            return
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        elements[path] = (kind, element.SerializeToString(deterministic=True))
+        if kind == "exception":
+            errors.append(f"{element.exception.type}: {element.exception.message}")
+        elif kind == "imgs":
+            media.extend(img.url for img in element.imgs.imgs if img.url.startswith("/media/"))
+        elif kind in WIDGET_TYPES:
+            widget = getattr(element, kind)
+            self.widgets[path] = (widget.id, kind, widget, delta.fragment_id)
+
+    def find(self, target):
+        """``(id, tipo, widget, fragmento)`` del widget con ``key`` o etiqueta ``target``."""
+        for wid, kind, widget, fragment_id in self.widgets.values():
+            if wid.endswith("-" + target) or getattr(widget, "label", None) == target:
+                return wid, kind, widget, fragment_id
+        return None
+
+    async def act(self, action, target, value):
+        """Aplica una acción del guion; ``None`` si su widget no está en la página."""
+        found = self.find(target)
+        if found is None:
+            return None
+        wid, kind, widget, fragment_id = found
+        state = WidgetState(id=wid)
+        if action == "click":
+            state.trigger_value = True
+        elif action == "tabs":
+            state.json_value = json.dumps(value)
+        else:
+            options = list(widget.options)
+            if not options:
+                return None
+            state.int_value = value % len(options) if isinstance(value, int) else options.index(value)
+        self.states[wid] = state
+        return await self.rerun(fragment_id)
+
+
+def _fingerprint(elements):
+    h = hashlib.sha1()
+    for path in sorted(elements):
+        kind, data = elements[path]
+        if kind not in VOLATILE_TYPES:
+            h.update(repr(path).encode())
+            h.update(data)
+    return h.hexdigest()
+
+
+async def run_session(base_url, scenario, iterations, think, rng, timeout, record):
+    """Recorre ``iterations`` veces el guion ``scenario``; cada rerun va a ``record``."""
+    session = Session(base_url, timeout)
+    try:
+        await session.connect()
+        seconds, fingerprint, errors = await session.rerun()
+        record(scenario, 0, -1, "carga inicial", seconds, fingerprint, errors)
+        for iteration in range(iterations):
+            for step, (action, target, value) in enumerate(SCENARIOS[scenario]):
+                if think:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))
+                result = await session.act(action, target, value)
+                if result is None:
+                    record(scenario, iteration, step, action, None, None, [])
+                else:
+                    record(scenario, iteration, step, action, *result)
+    except (SessionError, OSError) as e:
+        record(scenario, None, None, "conexión", None, None, [str(e)])
+    finally:
+        session.close()
+
+
+def rss_bytes(pid):
+    """RSS del proceso ``pid`` (``None`` si no hay ``/proc``)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+async def sample_rss(pid, samples, interval=0.5):
+    while True:
+        rss = rss_bytes(pid)
+        if rss is not None:
+            samples.append(rss)
+        await asyncio.sleep(interval)
+
+
+async def load(base_url, sessions, iterations, think, seed, timeout, ramp, pid=None):
+    """Corre las sesiones simultáneas y devuelve el informe."""
+    rng = random.Random(seed)
+    names = list(SCENARIOS)
+    reruns = []
+
+    def record(scenario, iteration, step, action, seconds, fingerprint, errors):
+        reruns.append({"guion": scenario, "vuelta": iteration, "paso": step, "acción": action,
+                       "segundos": seconds, "huella": fingerprint, "errores": errors})
+
+    # Calentamiento: una sesión por guion, fuera de la medición
+    for name in names:
+        await run_session(base_url, name, 1, 0, rng, timeout, lambda *args: None)
+
+    rss = []
+    sampler = asyncio.ensure_future(sample_rss(pid, rss)) if pid else None
+    rss_start = rss_bytes(pid) if pid else None
+
+    async def delayed(i):
+        await asyncio.sleep(ramp * i / max(sessions, 1))
+        await run_session(base_url, names[i % len(names)], iterations, think,
+                          random.Random(rng.random()), timeout, record)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(delayed(i) for i in range(sessions)))
+    wall = time.perf_counter() - start
+    if sampler is not None:
+        sampler.cancel()
+    rss_end = rss_bytes(pid) if pid else None
+    return report(reruns, wall, sessions, rss_start, rss_end, max(rss, default=None))
+
+
+def report(reruns, wall, sessions, rss_start, rss_end, rss_peak):
+    timed = [r for r in reruns if r["segundos"] is not None]
+    latencies = np.array([r["segundos"] for r in timed])
+
+    def percentiles(values):
+        if not len(values):
+            return {"p50": None, "p95": None, "p99": None}
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        return {"p50": p50, "p95": p95, "p99": p99}
+
+    by_action = defaultdict(list)
+    for r in timed:
+        by_action[r["acción"]].append(r["segundos"])
+
+    # Corrupción: en el mismo paso del mismo guion todas las sesiones deben ver lo mismo
+    fingerprints = defaultdict(Counter)
+    for r in timed:
+        fingerprints[(r["guion"], r["vuelta"], r["paso"])][r["huella"]] += 1
+    corrupted = sum(sum(counts.values()) - max(counts.values()) for counts in fingerprints.values())
+
+    errors = Counter(error for r in reruns for error in r["errores"])
+    mb = (lambda value: None if value is None else value / 2**20)
+    return {
+        "sesiones": sessions,
+        "reruns": len(timed),
+        "omitidos": sum(1 for r in reruns if r["segundos"] is None and not r["errores"]),
+        "segundos": wall,
+        "reruns_por_segundo": len(timed) / wall if wall else None,
+        "latencia": percentiles(latencies),
+        "latencia_por_acción": {action: {"n": len(values), **percentiles(np.array(values))}
+                                for action, values in sorted(by_action.items())},
+        "rss_inicial_mb": mb(rss_start),
+        "rss_final_mb": mb(rss_end),
+        "rss_pico_mb": mb(rss_peak),
+        "errores": sum(errors.values()),
+        "tipos_de_error": dict(errors.most_common(10)),
+        "corruptos": corrupted,
+    }
+
+
+def print_report(result):
+    ms = (lambda value: "-" if value is None else f"{value * 1000:8.0f} ms")
+    lat = result["latencia"]
+    print(f"{result['sesiones']} sesiones, {result['reruns']} reruns en {result['segundos']:.1f} s "
+          f"({result['reruns_por_segundo']:.1f} reruns/s, {result['omitidos']} acciones omitidas)")
+    print(f"{'acción':<16} {'n':>5} {'p50':>11} {'p95':>11} {'p99':>11}")
+    print(f"{'(todas)':<16} {result['reruns']:>5} {ms(lat['p50'])} {ms(lat['p95'])} {ms(lat['p99'])}")
+    for action, item in result["latencia_por_acción"].items():
+        print(f"{action:<16} {item['n']:>5} {ms(item['p50'])} {ms(item['p95'])} {ms(item['p99'])}")
+    if result["rss_inicial_mb"] is not None:
+        print(f"RSS del servidor: {result['rss_inicial_mb']:.0f} MB -> {result['rss_final_mb']:.0f} MB "
+              f"(pico {result['rss_pico_mb']:.0f} MB)")
+    print(f"Errores: {result['errores']}   Corruptos: {result['corruptos']}")
+    for error, n in result["tipos_de_error"].items():
+        print(f"  {n} x {error}")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, log, data_dir):
+    """``streamlit run`` del tablero en ``127.0.0.1:port`` (sin telemetría ni vigilancia de archivos)."""
+    command = [sys.executable, "-m", "streamlit", "run", SCRIPT, "--server.headless", "true",
+               "--server.address", "127.0.0.1", "--server.port", str(port),
+               "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"]
+    env = {**os.environ, "CAS_DATA_DIR": data_dir}
+    return subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, env=env)
+
+
+def generate_fixture(seed):
+    """Conjunto sintético pequeño en un directorio temporal; devuelve su ruta."""
+    from cas.generate import generate
+
+    data_dir = tempfile.mkdtemp(prefix="cas-loadtest-data-")
+    generate(data_dir, FIXTURE_INVENTORY_ROWS, FIXTURE_EDGES, seed)
+    return data_dir
+
+
+async def wait_healthy(base_url, server=None, timeout=120):
+    http = AsyncHTTPClient()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f"El servidor terminó con código {server.returncode}")
+        try:
+            await http.fetch(base_url + "/_stcore/health")
+            return
+        except (HTTPClientError, OSError):
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"El servidor no respondió en {timeout} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="sesiones simultáneas")
+    parser.add_argument("--iterations", type=int, default=3, help="vueltas de cada sesión por su guion")
+    parser.add_argument("--think", type=float, default=0.5,
+                        help="pausa media entre clics en segundos (0 = sin pausa)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="segundos para arrancar todas las sesiones")
+    parser.add_argument("--timeout", type=float, default=120.0, help="tiempo máximo por rerun")
+    parser.add_argument("--seed", type=int, default=42, help="semilla de las pausas")
+    parser.add_argument("--url", help="servidor ya levantado (por defecto se lanza uno local)")
+    parser.add_argument("--pid", type=int, help="pid del servidor de --url, para medir su RSS")
+    parser.add_argument("--data-dir", help="CAS_DATA_DIR del servidor lanzado "
+                                           "(por defecto, un conjunto sintético pequeño)")
+    parser.add_argument("--json", help="guardar el informe en este archivo")
+    args = parser.parse_args(argv)
+
+    server = log = fixture = None
+    if args.url:
+        base_url, pid = args.url.rstrip("/"), args.pid
+    else:
+        data_dir = args.data_dir
+        if data_dir is None:
+            data_dir = fixture = generate_fixture(args.seed)
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        log = tempfile.NamedTemporaryFile(prefix="cas-loadtest-", suffix=".log", delete=False)
+        server = start_server(port, log, data_dir)
+        pid = server.pid
+        print(f"Servidor en {base_url} (pid {pid}, datos en {data_dir}, log en {log.name})", flush=True)
+
+    async def run():
+        await wait_healthy(base_url, server)
+        return await load(base_url, args.sessions, args.iterations, args.think, args.seed, args.timeout,
+                          args.ramp, pid)
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+            log.close()
+        if fixture is not None:
+            shutil.rmtree(fixture, ignore_errors=True)
+    print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+    return 1 if result["errores"] or result["corruptos"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Motor de centralidades para las tablas de interpretación de las redes.
+
+Las métricas se calculan sobre la forma compacta de las redes
+(``cas.graphs.CompactGraph``), sin construir el grafo de networkx: grado por
+``np.bincount``, eigenvector por iteración de potencia con productos
+matriz-vector dispersos, cercanía por BFS vectorizado por niveles e
+intermediación por Brandes sobre la misma BFS (``tests/test_metrics.py``
+compara todas con networkx). En redes grandes la intermediación y la cercanía se estiman con una muestra
+de ``k`` fuentes. Los resultados se guardan en el almacén de artefactos
+(``cas.artifacts``), de modo que las tablas siguen al día cuando cambian los
+datos.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from cas.artifacts import STORE, track
+from cas.data import load_interpretation
+from cas.graphs import get_compact
+from cas.networks import NETWORKS
+
+# A partir de este número de nodos se usan estimaciones con k fuentes
+EXACT_MAX_NODES = 2000
+SAMPLE_SOURCES = 256
+SAMPLE_SEED = 42
+
+# Métricas de la tabla: prefijo de "Métrica" en el CSV -> columna calculada
+METRICS = [
+    ("Centralidad de Grado", "degree"),
+    ("Centralidad de Intermediación", "betweenness"),
+    ("Centralidad de Cercanía", "closeness"),
+    ("Centralidad de Eigenvector", "eigenvector"),
+    ("Número de Conexiones", "connections"),
+]
+
+# Descripciones por defecto si la red no tiene CSV de interpretación
+DEFAULT_DESCRIPTIONS = pd.DataFrame([
+    ["Centralidad de Grado", "Cantidad de conexiones directas (entrantes y salientes) de un nodo.",
+     "Nodos con más conexiones directas son actores centrales en términos de interacción."],
+    ["Centralidad de Intermediación", "Capacidad de un nodo para actuar como puente entre otros nodos.",
+     "Nodos con alta intermediación facilitan el flujo de información entre diferentes partes de la red."],
+    ["Centralidad de Cercanía", "Proximidad de un nodo a todos los demás nodos en términos de distancia.",
+     "Nodos con alta cercanía tienen acceso eficiente a la red y pueden difundir información rápidamente."],
+    ["Centralidad de Eigenvector", "Influencia de un nodo basada en sus conexiones con otros nodos importantes.",
+     "Nodos con alta centralidad eigenvector son altamente influyentes en la red global."],
+    ["Número de Conexiones", "Número total de enlaces directos de un nodo sin ponderar.",
+     "Nodos con más conexiones directas son muy activos en la red."],
+], columns=["Métrica", "¿Qué Mide?", "Interpretación"])
+
+TOP_NODES = 2
+
+
+def csr(n, src, dst):
+    """Listas de adyacencia comprimidas (``indptr``, ``indices``) de aristas en cualquier orden.
+
+    Un ``CompactGraph`` ya las tiene (``graph.indptr``, ``graph.dst``).
+    """
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst[order]
+
+
+def _frontier_edges(indptr, indices, frontier):
+    """Aristas (origen, destino) que salen de los nodos de ``frontier``."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    # Vecinos de toda la frontera en una sola indexación
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    return np.repeat(frontier, counts), indices[offsets]
+
+
+def bfs_distances(indptr, indices, source):
+    """Distancias en saltos desde ``source`` (-1 si no es alcanzable), por niveles."""
+    n = len(indptr) - 1
+    dist = np.full(n, -1, dtype=np.int64)
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        dist[frontier] = level
+        _, neighbors = _frontier_edges(indptr, indices, frontier)
+        frontier = np.unique(neighbors[dist[neighbors] < 0])
+        level += 1
+    return dist
+
+
+def betweenness_centrality(indptr, indices, sources):
+    """Brandes por niveles sobre la CSR (sin pesos, dirigido y normalizado como networkx).
+
+    Con ``sources`` igual a todos los nodos es exacta; con una muestra de k
+    fuentes se reescala por ``n / k`` como ``nx.betweenness_centrality(k=...)``.
+    """
+    n = len(indptr) - 1
+    betweenness = np.zeros(n)
+    for s in sources:
+        dist = np.full(n, -1, dtype=np.int64)
+        sigma = np.zeros(n)
+        dist[s], sigma[s] = 0, 1.0
+        frontier = np.array([s], dtype=np.int64)
+        dag = []  # Aristas de caminos más cortos, por nivel
+        level = 0
+        while frontier.size:
+            eu, ev = _frontier_edges(indptr, indices, frontier)
+            new = np.unique(ev[dist[ev] < 0])
+            dist[new] = level + 1
+            on_path = dist[ev] == level + 1
+            eu, ev = eu[on_path], ev[on_path]
+            sigma += np.bincount(ev, weights=sigma[eu], minlength=n)
+            dag.append((eu, ev))
+            frontier = new
+            level += 1
+        delta = np.zeros(n)
+        for eu, ev in reversed(dag):
+            delta += np.bincount(eu, weights=sigma[eu] / sigma[ev] * (1.0 + delta[ev]), minlength=n)
+        delta[s] = 0.0
+        betweenness += delta
+    scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    return betweenness * scale * n / len(sources)
+
+
+def degree_centrality(n, src, dst):
+    connections = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+    return connections, connections / max(n - 1, 1)
+
+
+def eigenvector_centrality(n, src, dst, max_iter=1000, tol=1.0e-6):
+    """Mismo esquema que ``nx.eigenvector_centrality`` (aristas entrantes, A + I)."""
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        xlast = x
+        x = xlast + np.bincount(dst, weights=xlast[src], minlength=n)
+        x /= np.linalg.norm(x) or 1.0
+        if np.abs(x - xlast).sum() < n * tol:
+            break
+    return x
+
+
+def closeness_centrality(indptr, indices, sources):
+    """Cercanía por distancias entrantes (como networkx), exacta si ``sources`` son todos los nodos."""
+    n = len(indptr) - 1
+    hits = np.zeros(n)
+    total = np.zeros(n)
+    for s in sources:
+        dist = bfs_distances(indptr, indices, s)
+        reached = dist > 0
+        hits[reached] += 1
+        total[reached] += dist[reached]
+    # Fuentes distintas de cada nodo (cada nodo no cuenta como fuente de sí mismo)
+    others = len(sources) - np.isin(np.arange(n), sources)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        closeness = (hits / total) * (hits / np.maximum(others, 1))
+    return np.nan_to_num(closeness)
+
+
+def centralities(graph):
+    """DataFrame (un nodo por fila) con las centralidades de ``graph`` (``CompactGraph``)."""
+    nodes = graph.names
+    src, dst = graph.src.astype(np.int64), graph.dst.astype(np.int64)
+    n = len(nodes)
+    if n <= EXACT_MAX_NODES:
+        sources = np.arange(n)
+    else:
+        sources = np.random.default_rng(SAMPLE_SEED).choice(n, SAMPLE_SOURCES, replace=False)
+    connections, degree = degree_centrality(n, src, dst)
+    return pd.DataFrame({
+        "degree": degree,
+        "betweenness": betweenness_centrality(graph.indptr, dst, sources),
+        "closeness": closeness_centrality(graph.indptr, dst, sources),
+        "eigenvector": eigenvector_centrality(n, src, dst),
+        "connections": connections,
+    }, index=pd.Index(nodes, name="Nodo"))
+
+
+def network_centralities(network_key):
+    return STORE.get(("centralities", network_key), lambda: centralities(get_compact(network_key)))
+
+
+def key_nodes(values, top=TOP_NODES):
+    """``"Nodo A (0.656); Nodo B (0.556)"`` con los ``top`` nodos de mayor valor."""
+    best = values.sort_values(ascending=False, kind="stable").head(top)
+    if pd.api.types.is_integer_dtype(values):
+        return "; ".join(f"{node} ({value})" for node, value in best.items())
+    return "; ".join(f"{node} ({value:.3f})" for node, value in best.items())
+
+
+def interpretation_table(network_key):
+    """Tabla de interpretación con la columna "Nodos Clave" calculada de la red actual."""
+    return STORE.get(("interpretation", network_key), lambda: _interpretation_table(network_key))
+
+
+def _interpretation_table(network_key):
+    spec = NETWORKS[network_key]
+    # Textos curados del CSV (si existe); los valores siempre se recalculan.
+    # Se registra aunque falte, para recalcular la tabla cuando aparezca.
+    track(spec.interpretation)
+    if not os.path.exists(spec.interpretation):
+        table = DEFAULT_DESCRIPTIONS.copy()
+    else:
+        table = load_interpretation(spec.interpretation).copy()
+    return with_key_nodes(table, network_centralities(network_key))
+
+
+def with_key_nodes(table, metrics):
+    """``table`` con su columna "Nodos Clave" calculada a partir de ``metrics``."""
+    key_column = []
+    for metric, existing in zip(table["Métrica"], table.get("Nodos Clave", [""] * len(table))):
+        column = next((col for prefix, col in METRICS if str(metric).startswith(prefix)), None)
+        key_column.append(key_nodes(metrics[column]) if column else existing)
+    table["Nodos Clave"] = key_column
+    return table
@@ -0,0 +1,49 @@
+"""Registro de las redes de extensión por cultivo."""
+import os
+from dataclasses import dataclass
+
+from cas.data import DATA_DIR
+
+
+@dataclass(frozen=True)
+class NetworkSpec:
+    key: str             # Etiqueta de la pestaña en la vista de redes
+    edges: str           # CSV de aristas (Origen;Destino;Tipo de Interacción;Periodicidad...)
+    interpretation: str  # CSV con la interpretación del análisis de red
+    title: str           # Título base de la figura
+    label: str           # Nombre corto usado en la interpretación
+    duplicates: str = "last"  # Aristas repetidas: "last" (última fila), "sum" o "mean" (ver cas.edges)
+
+    @property
+    def static_title(self):
+        return f"{self.title} - Estática"
+
+    @property
+    def interactive_title(self):
+        return f"{self.title} - Interactiva"
+
+
+NETWORKS = {
+    spec.key: spec for spec in [
+        NetworkSpec("Banano/ASBAMA",
+                    os.path.join(DATA_DIR, "ASBAMA.csv"),
+                    os.path.join(DATA_DIR, "ASBAMA_interpretacion_analisis_red.csv"),
+                    "Red del Sistema de Extensión del Banano (ASBAMA)", "ASBAMA"),
+        NetworkSpec("Banano/Augura",
+                    os.path.join(DATA_DIR, "AUGURA.csv"),
+                    os.path.join(DATA_DIR, "interpretacion_augura.csv"),
+                    "Red del Sistema de Extensión del Banano (Augura)", "Augura"),
+        NetworkSpec("Café",
+                    os.path.join(DATA_DIR, "red_productiva_cafe.csv"),
+                    os.path.join(DATA_DIR, "FNC_interpretacion.csv"),
+                    "Red Productiva del Café", "Café"),
+        NetworkSpec("Arroz",
+                    os.path.join(DATA_DIR, "redes_fedearroz.csv"),
+                    os.path.join(DATA_DIR, "Fedearroz_Centralidades.csv"),
+                    "Red del Sistema de Extensión del Arroz", "Arroz"),
+        NetworkSpec("Caña de azucar",
+                    os.path.join(DATA_DIR, "red cana.csv"),
+                    os.path.join(DATA_DIR, "Centralidades_Caña.csv"),
+                    "Red del Sistema de Extensión de Caña de azucar", "Caña de azucar"),
+    ]
+}
@@ -0,0 +1,223 @@
+"""Precálculo de artefactos en el despliegue.
+
+Construye en paralelo, en un ``ProcessPoolExecutor``, todo lo que la app
+calcularía en la primera visita (grafos, layouts, figuras estáticas, HTML de
+PyVis, payloads del componente, centralidades, tablas de interpretación,
+índice del inventario, capacidad, grafo combinado y las páginas reducidas del
+carrusel) y lo guarda en un directorio versionado::
+
+    python -m cas.precompute --workers 8
+
+La versión depende del contenido de los archivos fuente y de las versiones de
+Python y de las librerías, de modo que un despliegue con otros datos o
+dependencias escribe otro directorio. Al arrancar, la app registra (sin
+deserializar nada) los artefactos cuyas fuentes no cambiaron: compara la fecha
+y el tamaño guardados en el manifiesto y solo lee el contenido de una fuente con
+el mismo tamaño y otra fecha. Cada artefacto se lee de disco la primera vez que
+se pide. Los layouts quedan además en su propio
+caché (``cas.layouts``).
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+
+from cas.artifacts import STORE, key_id, source_version
+from cas.data import DATA_DIR
+
+ARTIFACT_DIR = os.environ.get("CAS_ARTIFACT_DIR", os.path.join(DATA_DIR, ".cache", "artifacts"))
+CURRENT_FILE = "current.json"
+MANIFEST_FILE = "manifest.json"
+# Cambiar cuando cambie el formato de los archivos o de las claves
+FORMAT_VERSION = 2
+KEEP_BUILDS = 3
+
+LIBRARIES = ["networkx", "pandas", "numpy", "matplotlib", "pyvis", "pillow", "pyarrow"]
+
+
+def content_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def environment():
+    """Versiones de las que dependen los artefactos serializados."""
+    versions = {"python": "%d.%d" % sys.version_info[:2], "formato": FORMAT_VERSION}
+    for name in LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def tasks():
+    from cas.images import BRIEF_PAGES
+    from cas.networks import NETWORKS
+
+    return ([("network", key) for key in NETWORKS] + [("inventory", None), ("capacity", None), ("combined", None)]
+            + [("image", path) for pages in BRIEF_PAGES.values() for path in pages])
+
+
+def run_task(task):
+    """Calcula los artefactos de ``task`` (en un proceso del pool) y los devuelve serializados."""
+    kind, arg = task
+    # Cada tarea devuelve solo lo suyo; los procesos del pool no vigilan archivos
+    STORE.interval = 0
+    STORE.clear()
+    if kind == "image":
+        from cas.images import BRIEF_WIDTH, encode_image
+        return [(key_id(("image", arg, BRIEF_WIDTH, "JPEG")), "image", pickle.dumps(encode_image(arg)), [arg])]
+
+    if kind == "network":
+        from cas.metrics import interpretation_table
+        from cas.networks import NETWORKS
+        from cas.render import network_payload, render_network_interactive, render_network_static
+
+        spec = NETWORKS[arg]
+        render_network_static(arg, spec.static_title)
+        render_network_interactive(arg)
+        network_payload(arg)
+        interpretation_table(arg)
+    elif kind == "inventory":
+        from cas.inventory import get_inventory_index
+        get_inventory_index()
+    elif kind == "capacity":
+        from cas.capacity import get_capacity
+        get_capacity()
+    elif kind == "combined":
+        from cas.combined import get_combined_graph
+        get_combined_graph()
+    # Todo lo que quedó en el almacén de este proceso, con los archivos de los que depende
+    return [(key_id(key), key[0], pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), sources)
+            for key, value, sources in STORE.items()]
+
+
+def build(directory=ARTIFACT_DIR, workers=None):
+    """Calcula todos los artefactos y los publica como la versión actual; devuelve su carpeta."""
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for artifacts in pool.map(run_task, tasks()):
+            for ident, kind, blob, sources in artifacts:
+                results.setdefault(ident, (kind, blob, sources))
+
+    sources = sorted({source for _, _, deps in results.values() for source in deps})
+    # ``None``: la fuente no existía (p. ej. una interpretación opcional)
+    hashes = {source: content_hash(source) if os.path.exists(source) else None for source in sources}
+    env = environment()
+    version = hashlib.sha256(json.dumps([hashes, env], sort_keys=True).encode()).hexdigest()[:16]
+    # (mtime, tamaño) al precalcular: al arrancar basta un ``os.stat`` por fuente
+    states = {source: source_version(source) for source in sources}
+
+    target = os.path.join(directory, version)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(tmp, exist_ok=True)
+    manifest = {"version": version, "entorno": env, "artefactos": {},
+                "fuentes": {source: {"sha256": hashes[source], "estado": states[source]} for source in sources}}
+    for n, (ident, (kind, blob, deps)) in enumerate(sorted(results.items())):
+        name = f"{kind}-{n:04d}.pkl"
+        with open(os.path.join(tmp, name), "wb") as f:
+            f.write(blob)
+        manifest["artefactos"][ident] = {"archivo": name, "fuentes": deps}
+    with open(os.path.join(tmp, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+    # Publicación atómica: primero la carpeta completa, después el puntero
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp, target)
+    _write_current(directory, version)
+    _prune(directory, keep=version)
+    print(f"{len(results)} artefactos de {len(sources)} fuentes en {target} "
+          f"({time.perf_counter() - start:.1f} s)")
+    return target
+
+
+def _write_current(directory, version):
+    path = os.path.join(directory, CURRENT_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": version}, f)
+    os.replace(tmp, path)
+
+
+def _prune(directory, keep):
+    builds = [entry for entry in os.scandir(directory) if entry.is_dir() and not entry.name.endswith(".tmp")]
+    builds.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in builds[KEEP_BUILDS:]:
+        if entry.name != keep:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def load_artifacts(directory=ARTIFACT_DIR):
+    """Registra en el almacén los artefactos precalculados vigentes; devuelve cuántos."""
+    try:
+        with open(os.path.join(directory, CURRENT_FILE), encoding="utf-8") as f:
+            version = json.load(f)["version"]
+        with open(os.path.join(directory, version, MANIFEST_FILE), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError, KeyError):
+        return 0
+    if manifest["entorno"] != environment():
+        return 0
+    # Solo valen los artefactos cuyas fuentes tienen el mismo contenido que al precalcular
+    valid = {}
+    for source, recorded in manifest["fuentes"].items():
+        state = source_version(source)
+        if _same_source(source, state, recorded):
+            valid[source] = state
+    artifacts = {
+        ident: (os.path.join(directory, version, item["archivo"]),
+                {source: valid[source] for source in item["fuentes"]})
+        for ident, item in manifest["artefactos"].items()
+        if all(source in valid for source in item["fuentes"])
+    }
+    STORE.preload(artifacts)
+    return len(artifacts)
+
+
+def _same_source(path, state, recorded):
+    saved = recorded["estado"] and tuple(recorded["estado"])
+    if state == saved:
+        return True
+    # Misma longitud y otra fecha (p. ej. datos copiados después de precalcular):
+    # solo entonces se lee el archivo para comparar su contenido
+    return (state is not None and saved is not None and state[1] == saved[1]
+            and content_hash(path) == recorded["sha256"])
+
+
+_loaded = False
+
+
+def load_artifacts_once():
+    """``load_artifacts`` una sola vez por proceso (la app lo llama en cada rerun)."""
+    global _loaded
+    if not _loaded:
+        _loaded = True
+        from cas.timing import record
+
+        start = time.perf_counter()
+        count = load_artifacts()
+        record(f"artefactos precalculados ({count})", time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool (por defecto, uno por núcleo)")
+    parser.add_argument("--dir", default=ARTIFACT_DIR, help="directorio de artefactos")
+    args = parser.parse_args(argv)
+    build(args.dir, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Instrumentación opcional de cada rerun.
+
+Con ``CAS_PROFILE=1`` cada rerun de ``inventario.py`` registra el tiempo y la
+memoria neta (``tracemalloc``) de sus etapas (carga, filtros, construcción de
+grafos, layout, dibujo, HTML, imágenes), los aciertos y fallos de los cachés y
+el tamaño de lo que se envía al navegador. El resultado se muestra en un panel
+de depuración de la barra lateral y, con ``CAS_PROFILE_LOG=<ruta>``, se agrega
+como una línea JSON por rerun para consolidar varias instancias. Los fragmentos
+(``fragment``) que vuelven a ejecutarse solos registran su propio perfil. El
+panel muestra también los tiempos de arranque del proceso (``cas.timing``).
+
+Sin ``CAS_PROFILE`` todas las funciones son no-ops. La memoria se mide con el
+``tracemalloc`` del proceso: con varias sesiones simultáneas es aproximada.
+"""
+import functools
+import json
+import os
+import socket
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("CAS_PROFILE", "") not in ("", "0")
+LOG_PATH = os.environ.get("CAS_PROFILE_LOG")
+# Reruns que conserva cada sesión para descargar
+HISTORY_SIZE = 50
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class Profile:
+    def __init__(self, view, fragment=None):
+        self.view = view
+        self.fragment = fragment
+        self.started = time.time()
+        self.seconds = None
+        self.stages = []
+        self.counters = Counter()
+        self.payloads = Counter()
+
+    def to_dict(self):
+        return {
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "inicio": self.started,
+            "vista": self.view,
+            "fragmento": self.fragment,
+            "segundos": self.seconds,
+            "etapas": self.stages,
+            "cachés": dict(self.counters),
+            "payloads_bytes": dict(self.payloads),
+        }
+
+
+def current():
+    """Perfil del rerun que corre en este hilo (``None`` si no se está perfilando)."""
+    return getattr(_local, "profile", None)
+
+
+def start(view, fragment=None):
+    if not ENABLED:
+        return None
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _local.profile = Profile(view, fragment)
+    return _local.profile
+
+
+def finish():
+    """Cierra el perfil del rerun actual y lo agrega al log JSONL si está configurado."""
+    profile = current()
+    if profile is None:
+        return None
+    _local.profile = None
+    profile.seconds = time.time() - profile.started
+    if LOG_PATH:
+        line = json.dumps(profile.to_dict(), ensure_ascii=False, default=str)
+        with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    return profile
+
+
+@contextmanager
+def stage(name):
+    profile = current()
+    if profile is None:
+        yield
+        return
+    memory = tracemalloc.get_traced_memory()[0]
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.stages.append({
+            "etapa": name,
+            "segundos": time.perf_counter() - start_time,
+            "memoria_kb": (tracemalloc.get_traced_memory()[0] - memory) / 1024,
+        })
+
+
+def count(cache, event):
+    """Suma un acierto (``"hit"``) o fallo (``"miss"``) del caché ``cache``."""
+    profile = current()
+    if profile is not None:
+        profile.counters[f"{cache}: {event}"] += 1
+
+
+def payload(name, value):
+    """Registra el tamaño de ``value`` (bytes, texto u objeto JSON) enviado al navegador."""
+    profile = current()
+    if profile is None:
+        return
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    elif not isinstance(value, (bytes, bytearray)):
+        value = json.dumps(value, default=str).encode("utf-8")
+    profile.payloads[name] += len(value)
+
+
+def fragment(view):
+    """``st.fragment`` de la vista ``view`` que también perfila sus reruns propios.
+
+    En un rerun completo el fragmento es una etapa más del perfil en curso; cuando
+    vuelve a ejecutarse solo (pestañas, páginas, "Cargar más") abre y cierra su
+    propio perfil, que va al log JSONL y al historial de la sesión (el panel de
+    depuración no puede dibujarse desde un fragmento y lo muestra en el siguiente
+    rerun completo).
+    """
+    import streamlit as st
+
+    def decorator(func):
+        name = f"fragmento: {func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED or current() is not None:
+                with stage(name):
+                    return func(*args, **kwargs)
+            start(view, func.__name__)
+            try:
+                with stage(name):
+                    return func(*args, **kwargs)
+            finally:
+                _remember(finish())
+
+        return st.fragment(wrapper)
+
+    return decorator
+
+
+def _remember(profile):
+    import streamlit as st
+
+    history = st.session_state.setdefault("profile_history", [])
+    history.append(profile.to_dict())
+    del history[:-HISTORY_SIZE]
+    return history
+
+
+def debug_panel(profile):
+    """Panel de la barra lateral: perfil del rerun, arranque del proceso y descarga de los anteriores."""
+    import pandas as pd
+    import streamlit as st
+
+    from cas.timing import startup_report
+
+    history = _remember(profile)
+
+    with st.sidebar.expander(f"Depuración: {profile.seconds * 1000:.0f} ms"):
+        if profile.stages:
+            stages = pd.DataFrame(profile.stages)
+            stages["ms"] = (stages.pop("segundos") * 1000).round(1)
+            st.dataframe(stages.round(1), hide_index=True, use_container_width=True)
+        if profile.counters:
+            st.markdown("**Cachés**")
+            st.dataframe(pd.Series(profile.counters, name="veces").sort_index(), use_container_width=True)
+        if profile.payloads:
+            st.markdown("**Enviado al navegador**")
+            st.dataframe((pd.Series(profile.payloads, name="KB") / 1024).round(1), use_container_width=True)
+        startup = startup_report()
+        if startup:
+            st.markdown("**Arranque del proceso**")
+            startup = pd.DataFrame(startup, columns=["etapa", "segundos"])
+            startup["ms"] = (startup.pop("segundos") * 1000).round(1)
+            st.dataframe(startup, hide_index=True, use_container_width=True)
+        st.download_button("Descargar reruns (JSONL)", key="profile_download", mime="application/json",
+                           file_name="perfil.jsonl",
+                           data="\n".join(json.dumps(item, ensure_ascii=False, default=str) for item in history))
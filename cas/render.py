@@ -0,0 +1,152 @@
+"""Render de las redes a imágenes y HTML listos para servir.
+
+La figura estática se dibuja sobre un ``Figure`` explícito (sin el estado
+global de ``pyplot``, que no es seguro entre sesiones) y se guarda como bytes
+PNG/SVG. Los bytes se guardan en el almacén de artefactos (``cas.artifacts``)
+por red, parámetros de layout y estilo, de modo que repetir una vista no
+vuelve a tocar Matplotlib ni deja figuras abiertas.
+El HTML de PyVis se genera directamente en memoria (sin archivo temporal
+compartido entre sesiones) y se memoiza por red y opciones; para el componente
+ligero (``cas.component``) basta el JSON de nodos y aristas de la red.
+"""
+import io
+import json
+
+import networkx as nx
+import numpy as np
+from matplotlib.figure import Figure
+from pyvis.network import Network
+
+from cas.artifacts import STORE
+from cas.data import file_version
+from cas.graphs import ACTOR_TYPE_NAMES, LABEL_WIDTH, get_compact, get_graph
+from cas.largegraph import aggregated_payload, is_large
+from cas.layouts import SPRING_PARAMS, spring_layout
+from cas.networks import NETWORKS
+
+# Colores de nodo por tipo de actor (ver ``cas.graphs.ACTOR_TYPES``)
+ACTOR_COLORS = {"Productores": "lightblue", "Asistentes": "lightgreen", "Investigadores": "plum",
+                "CENIBANANO": "lightcoral", "Servicio": "orange"}
+DEFAULT_COLOR = "gray"
+# Color por código de tipo (``CompactGraph.type_codes``)
+TYPE_COLORS = np.array([ACTOR_COLORS.get(t, DEFAULT_COLOR) for t in ACTOR_TYPE_NAMES], dtype=object)
+
+# Estilo de la figura estática
+STATIC_STYLE = {
+    "figsize": (18, 14),
+    "dpi": 200,              # Igual que el valor por defecto de st.pyplot
+    "font_size": 10,
+    "title_size": 16,
+    "size_per_degree": 300,
+    "label_width": LABEL_WIDTH,
+}
+
+# Opciones de física de la vista interactiva (PyVis / vis-network)
+INTERACTIVE_PHYSICS = {
+    "physics": {
+        "barnesHut": {
+            "gravitationalConstant": -8000,
+            "centralGravity": 0.3,
+            "springLength": 95,
+            "springConstant": 0.04,
+            "damping": 0.09,
+            "avoidOverlap": 0,
+        },
+        "minVelocity": 0.75,
+    }
+}
+INTERACTIVE_OPTIONS = "var options = " + json.dumps(INTERACTIVE_PHYSICS)
+
+# Estilo de nodo por defecto de PyVis, para que ambos modos se vean igual
+PYVIS_NODE_STYLE = {"color": "#97c2fc", "shape": "dot", "font": {"color": "black"}}
+
+
+def render_network_static(network_key, title, fmt="png", layout_params=None, style=None):
+    """Bytes de la figura estática de la red ``network_key`` (PNG o SVG)."""
+    layout_items = tuple(sorted({**SPRING_PARAMS, **(layout_params or {})}.items()))
+    style_items = tuple(sorted({**STATIC_STYLE, **(style or {})}.items()))
+    key = ("static", network_key, title, fmt, layout_items, style_items)
+    return STORE.get(key, lambda: static_figure(get_compact(network_key), title, fmt, layout_items, style_items,
+                                                G=get_graph(network_key)))
+
+
+def static_figure(graph, title, fmt, layout_items, style_items, G=None):
+    """Bytes de la figura estática de ``graph`` (sin caché; ver ``render_network_static``).
+
+    ``G`` es el ``nx.DiGraph`` de ``graph`` si ya está construido.
+    """
+    style = dict(style_items)
+    if G is None:
+        G = graph.to_networkx()
+    pos = spring_layout(G, **dict(layout_items))
+
+    # Arreglos alineados con G.nodes() y G.edges() (ver ``CompactGraph``)
+    node_size = graph.degree * style["size_per_degree"]
+    color_map = TYPE_COLORS[graph.type_codes].tolist()
+    edge_width = graph.weight / 2
+    names = graph.names.tolist()
+    wrapped_labels = dict(zip(names, graph.wrapped_labels(style["label_width"]).tolist()))
+    edge_labels = dict(zip(zip(graph.names[graph.src].tolist(), graph.names[graph.dst].tolist()),
+                           graph.labels.tolist()))
+
+    fig = Figure(figsize=style["figsize"])
+    # Mismo lienzo que ``nx.draw`` crea cuando no recibe ejes
+    ax = fig.add_axes((0, 0, 1, 1))
+    nx.draw(G, pos, ax=ax, with_labels=True, labels=wrapped_labels, node_color=color_map,
+            node_size=node_size, font_size=style["font_size"], font_weight="bold",
+            edge_color="gray", width=edge_width)
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax, font_size=style["font_size"],
+                                 font_color="darkred", rotate=True)
+    ax.set_title(title, fontsize=style["title_size"])
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, dpi=style["dpi"], bbox_inches="tight")
+    return buf.getvalue()
+
+
+def render_network_interactive(network_key, height="700px", options=INTERACTIVE_OPTIONS):
+    """Documento HTML de PyVis para la red ``network_key``, generado en memoria."""
+    key = ("interactive", network_key, height, options)
+    return STORE.get(key, lambda: pyvis_html(get_compact(network_key), height, options))
+
+
+def pyvis_html(graph, height, options):
+    net = Network(height=height, width="100%", bgcolor="#FFFFFF", font_color="black")
+    for node in graph.names.tolist():
+        net.add_node(node, label=node, title=node)
+    for u, v, weight, label in _edge_rows(graph):
+        net.add_edge(u, v, value=weight, title=label)
+    net.set_options(options)
+    return net.generate_html(notebook=False)
+
+
+def network_payload(network_key, expanded=frozenset()):
+    """Nodos, aristas y opciones de la red en el formato de vis-network.
+
+    Las redes grandes (``cas.largegraph``) se envían agregadas por tipo de
+    actor, con los grupos de ``expanded`` desplegados.
+    """
+    expanded = frozenset(expanded)
+    return STORE.get(("payload", network_key, expanded), lambda: _network_payload(network_key, expanded))
+
+
+def _network_payload(network_key, expanded):
+    version = file_version(NETWORKS[network_key].edges)
+    return graph_payload(get_compact(network_key), f"{network_key}:{version[0]}:{version[1]}", expanded)
+
+
+def graph_payload(graph, tag, expanded=frozenset()):
+    """Payload de vis-network para ``graph``; ``tag`` identifica la versión de los datos."""
+    if is_large(graph):
+        payload = aggregated_payload(graph, ACTOR_COLORS, DEFAULT_COLOR, expanded)
+        return {**payload, "version": tag + ":" + ",".join(sorted(expanded))}
+    nodes = [{"id": node, "label": node, "title": node, **PYVIS_NODE_STYLE} for node in graph.names.tolist()]
+    # NaN no es JSON válido para el navegador
+    edges = [{"from": u, "to": v, "value": None if weight != weight else weight, "title": label}
+             for u, v, weight, label in _edge_rows(graph)]
+    return {"nodes": nodes, "edges": edges, "options": INTERACTIVE_PHYSICS, "version": tag}
+
+
+def _edge_rows(graph):
+    return zip(graph.names[graph.src].tolist(), graph.names[graph.dst].tolist(), graph.weight.tolist(),
+               graph.labels.tolist())
@@ -0,0 +1,70 @@
+"""Tiempos de arranque: importación perezosa de vistas y reporte en frío.
+
+``import_view`` importa el módulo de una vista la primera vez que se
+selecciona y registra cuánto tardó; con ``CAS_PROFILE=1`` esas etapas se ven en
+el panel de depuración (``cas.profiling.debug_panel``). El reporte de arranque en frío mide, cada
+uno en un intérprete nuevo, la base de la app y la importación de cada vista::
+
+    python -m cas.timing
+"""
+import importlib
+import logging
+import subprocess
+import sys
+import time
+
+from cas.views import VIEWS
+
+logger = logging.getLogger("cas")
+
+# Etapas de arranque registradas en este proceso: [(etapa, segundos)]
+_startup = []
+_first_render_done = False
+
+
+def record(stage, seconds):
+    _startup.append((stage, seconds))
+    logger.info("arranque: %s %.3f s", stage, seconds)
+
+
+def record_first_render(view, seconds):
+    """Registra solo el primer render del proceso (las demás reruns ya están en caliente)."""
+    global _first_render_done
+    if not _first_render_done:
+        _first_render_done = True
+        record(f"primer render ({view})", seconds)
+
+
+def startup_report():
+    return list(_startup)
+
+
+def import_view(module_name):
+    """Módulo de la vista, importado (y cronometrado) solo la primera vez."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        record(f"import {module_name}", time.perf_counter() - start)
+    return module
+
+
+def _cold_import_time(statement):
+    code = ("import time; start = time.perf_counter(); "
+            f"{statement}; print(time.perf_counter() - start)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    base = _cold_import_time("import streamlit, cas.timing")
+    print(f"{'base (streamlit + cas.timing)':<45} {base:7.3f} s")
+    for view, module_name in VIEWS.items():
+        # La base ya está importada: se mide solo el costo propio de la vista
+        seconds = _cold_import_time(f"import streamlit, cas.timing; start = time.perf_counter(); "
+                                    f"import {module_name}")
+        print(f"{view:<45} {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
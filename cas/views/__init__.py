@@ -0,0 +1,14 @@
+"""Vistas del tablero; cada módulo importa sus dependencias pesadas al cargarse.
+
+``inventario.py`` importa solo el módulo de la vista seleccionada (ver
+``cas.timing.import_view``), de modo que abrir una vista no paga el costo de
+importar Matplotlib, networkx o PyVis de las demás.
+"""
+
+# Opción del selector de vistas -> módulo que la dibuja con ``render()``
+VIEWS = {
+    "Capacidad de Modelos de extensión": "cas.views.capacity",
+    "Inventario": "cas.views.inventory",
+    "Análisis de red por cultivos": "cas.views.networks",
+    "Brief: Caracterización ME": "cas.views.brief",
+}
@@ -0,0 +1,47 @@
+"""VISTA 3: Brief: caracterización."""
+import streamlit as st
+import streamlit_shadcn_ui as ui
+
+from cas import profiling
+from cas.images import BRIEF_PAGES, image_bytes, prefetch
+
+
+def render():
+    st.header("Caracterización de modelos de extensión", divider='blue')
+    carousel()
+
+
+def turn_page(index_key, step, n_pages):
+    # Se aplica antes del rerun: la imagen mostrada ya es la nueva página
+    st.session_state[index_key] = min(max(st.session_state[index_key] + step, 0), n_pages - 1)
+
+
+def page_buttons(position, index_key, n_pages):
+    col1, col2, col3 = st.columns([1, 6, 1])
+    with col1:
+        st.button("⬅ Página anterior", key=f"brief_{position}_prev", on_click=turn_page, args=(index_key, -1, n_pages))
+    with col3:
+        st.button("Página siguiente ➡", key=f"brief_{position}_next", on_click=turn_page, args=(index_key, 1, n_pages))
+
+
+# Cambiar de pestaña o de página solo vuelve a ejecutar el carrusel
+@profiling.fragment("Brief: Caracterización ME")
+def carousel():
+    tabs = ui.tabs(options=list(BRIEF_PAGES), default_value='Caña de azucar', key="brief_tabs")
+
+    current_images = BRIEF_PAGES[tabs]
+    index_key = f"brief_page_{tabs}"
+    st.session_state.setdefault(index_key, 0)
+    current_index = st.session_state[index_key]
+
+    # ---- Botones ARRIBA de la imagen ----
+    page_buttons("top", index_key, len(current_images))
+
+    # Imagen (derivado de 700 px en caché) y precarga de las páginas vecinas
+    page = image_bytes(current_images[current_index])
+    profiling.payload("imagen del brief", page)
+    st.image(page, width=700, caption=f"{tabs} ({current_index + 1} / {len(current_images)})")
+    prefetch([current_images[i] for i in (current_index - 1, current_index + 1) if 0 <= i < len(current_images)])
+
+    # ---- Botones ABAJO de la imagen ----
+    page_buttons("bottom", index_key, len(current_images))
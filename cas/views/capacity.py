@@ -0,0 +1,54 @@
+"""VISTA 4: Capacidad modelos de extensión."""
+import streamlit as st
+import streamlit_shadcn_ui as ui
+
+from cas import profiling
+from cas.capacity import CAPACITY_STYLES, get_capacity, organization_sections
+
+
+def render():
+    st.header("Capacidad de Modelos de extensión")
+
+    # ==== CSS para tarjetas y paneles ====
+    for css in CAPACITY_STYLES:
+        st.markdown(css, unsafe_allow_html=True)
+
+    organization_panel()
+
+
+# Cambiar de pestaña o de escenario solo vuelve a ejecutar este fragmento
+@profiling.fragment("Capacidad de Modelos de extensión")
+def organization_panel():
+    # Indicadores y métricas de todas las organizaciones (memoizados por versión de los CSV)
+    try:
+        capacity = get_capacity()
+    except Exception as e:
+        st.error("Error al leer los CSV de capacidad: " + str(e))
+        st.stop()
+
+    # ==== Pestañas para alternar vistas ====
+    TF = ui.tabs(
+        options=capacity.tabs,
+        default_value='Banano/ASBAMA',
+        key='capacity_tabs'
+    )
+
+    org = capacity.organization(TF)
+    scenarios = capacity.scenarios(org["Organización"]) if org is not None else []
+    if not scenarios:
+        st.info(f"🔨 En construcción para {TF}")
+        return
+    scenario = st.selectbox("Escenario", scenarios, key="capacity_scenario") if len(scenarios) > 1 else scenarios[0]
+
+    for heading, columns, spaced in organization_sections(capacity, org, scenario):
+        if spaced:
+            st.markdown("<br>", unsafe_allow_html=True)
+        if heading:
+            st.subheader(heading)
+        if len(columns) == 1:
+            st.markdown(columns[0], unsafe_allow_html=True)
+            continue
+        for column, html in zip(st.columns(len(columns)), columns):
+            if html:
+                with column:
+                    st.markdown(html, unsafe_allow_html=True)
@@ -0,0 +1,73 @@
+"""VISTA 1: Inventario (Productos filtrados por cultivo)."""
+import streamlit as st
+
+from cas import profiling
+from cas.inventory import PAGE_SIZE, get_inventory_index
+
+
+def render():
+    st.header("Inventario de entregables proyecto CAS", divider='blue')
+    
+    # Índice del inventario (memoizado): cada filtro es una búsqueda en diccionario
+    try:
+        index = get_inventory_index()
+    except Exception as e:
+        st.error("Error al leer el CSV de inventario: " + str(e))
+        st.stop()
+    
+    # --- Sidebar: Filtros de Inventario ---
+    st.sidebar.header("Filtros de Inventario")
+    
+    # Filtro por Componente
+    selected_componente = st.sidebar.selectbox("Selecciona un Componente", index.componentes)
+    
+    # Filtro por Resultado (del componente seleccionado)
+    resultados = index.resultados(selected_componente)
+    selected_resultado = st.sidebar.selectbox("Selecciona un Resultado", resultados)
+    
+    # Opciones de cultivos a partir de la columna "Cultivos Asociados"
+    cultivo_options = index.cultivos(selected_componente, selected_resultado)
+    
+    # Selector de cultivo, con opción "todos" por defecto
+    selected_cultivo = st.sidebar.selectbox(
+        "Selecciona un Cultivo",
+        options=cultivo_options,
+        index=cultivo_options.index("todos")
+    )
+    
+    # Filas del cultivo seleccionado ("todos" devuelve todo el Resultado)
+    with profiling.stage("filtrar inventario"):
+        rows = index.rows(selected_componente, selected_resultado, selected_cultivo)
+    
+    st.subheader(f"Productos por sistema productivo: {selected_cultivo.capitalize() if selected_cultivo != 'todos' else 'Todos'}")
+    
+    if len(rows) == 0:
+        st.write("No hay inventario para los filtros seleccionados.")
+    else:
+        # Al cambiar los filtros se vuelve a la primera página
+        filters = (selected_componente, selected_resultado, selected_cultivo)
+        if st.session_state.get("inventory_filters") != filters:
+            st.session_state["inventory_filters"] = filters
+            st.session_state["inventory_pages"] = 1
+        show_cards(index, rows)
+
+
+def load_more():
+    st.session_state["inventory_pages"] += 1
+
+
+# "Cargar más" solo vuelve a ejecutar este fragmento (los filtros del sidebar no cambian)
+@profiling.fragment("Inventario")
+def show_cards(index, rows):
+    n_pages = -(-len(rows) // PAGE_SIZE)
+    shown_pages = min(st.session_state["inventory_pages"], n_pages)
+    
+    # Un solo elemento por página con sus tarjetas .product-card ya armadas
+    for page in range(shown_pages):
+        html = index.page_html(rows, page)
+        profiling.payload("tarjetas del inventario", html)
+        st.markdown(html, unsafe_allow_html=True)
+    
+    st.caption(f"Mostrando {min(shown_pages * PAGE_SIZE, len(rows))} de {len(rows)} productos")
+    if shown_pages < n_pages:
+        st.button("Cargar más productos", on_click=load_more, key="inventory_load_more")
@@ -0,0 +1,136 @@
+"""VISTA 2: Análisis de Red por Cultivos (con opción de visualización)."""
+import functools
+
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+import streamlit_shadcn_ui as ui
+
+from cas import profiling
+from cas.combined import get_combined_graph
+from cas.component import INTERACTIVE_MODE, network_component
+from cas.metrics import interpretation_table
+from cas.networks import NETWORKS
+from cas.render import network_payload, render_network_interactive, render_network_static
+
+if not hasattr(np, 'Inf'):
+    np.Inf = np.inf
+
+
+# Función para dibujar la red de forma estática (Matplotlib)
+def draw_network_static(network_key, title):
+    # PNG memoizado por red, layout y estilo: las vistas repetidas no usan Matplotlib
+    try:
+        png = render_network_static(network_key, title)
+    except Exception as e:
+        st.error(f"Error al leer el CSV de red ({title}): " + str(e))
+        st.stop()
+    profiling.payload("red: figura estática", png)
+    st.image(png, use_column_width=True)
+
+
+# Función para dibujar la red interactiva usando PyVis
+def draw_network_interactive(network_key, title):
+    try:
+        if INTERACTIVE_MODE == "pyvis":
+            # HTML generado en memoria y memoizado por red (sin archivo temporal compartido)
+            html_content = render_network_interactive(network_key)
+        else:
+            # Solo el JSON de la red; la plantilla y vis-network quedan en caché del navegador
+            payload = network_payload(network_key, st.session_state.get(f"expanded_{network_key}", set()))
+    except Exception as e:
+        st.error(f"Error al leer el CSV de red ({title}): " + str(e))
+        st.stop()
+    st.subheader(title)
+    if INTERACTIVE_MODE == "pyvis":
+        profiling.payload("red: HTML PyVis", html_content)
+        components.html(html_content, height=750, scrolling=True)
+    else:
+        profiling.payload("red: componente", payload)
+        network_component(payload, key="network_view",
+                          on_change=functools.partial(toggle_cluster, network_key))
+
+
+def toggle_cluster(network_key):
+    # Clic sobre un grupo de una red grande: expandirlo o contraerlo en el próximo render
+    clicked = st.session_state.get("network_view")
+    if clicked:
+        expanded = st.session_state.setdefault(f"expanded_{network_key}", set())
+        expanded ^= {clicked["node"]}
+
+
+# Función para mostrar la interpretación de la red
+def show_interpretation(network_key, title):
+    st.subheader(f"Interpretación del Análisis de Red ({title})")
+    try:
+        # Textos del CSV de interpretación con los "Nodos Clave" calculados de la red actual
+        df_interpret = interpretation_table(network_key)
+    except Exception as e:
+        st.error(f"Error al leer el CSV de interpretación ({title}): " + str(e))
+    else:
+        # Convertir el DataFrame a HTML sin índice
+        html_table = df_interpret.to_html(index=False)
+        profiling.payload("red: interpretación", html_table)
+        st.markdown(html_table, unsafe_allow_html=True)
+
+
+# Consultas sobre el grafo combinado de todas las redes (fragmento independiente)
+@profiling.fragment("Análisis de red por cultivos")
+def show_cross_crop_queries():
+    with st.expander("Consultas entre cultivos"):
+        combined = get_combined_graph()
+        actors = sorted(combined.actors["Actor"], key=str.casefold)
+        st.markdown(f"**{len(combined)}** actores únicos en **{len(NETWORKS)}** redes.")
+
+        bridges = combined.bridging_actors()
+        st.markdown("**Actores presentes en varias redes**")
+        if bridges.empty:
+            st.write("Ningún actor aparece en más de una red.")
+        else:
+            st.dataframe(bridges.assign(Redes=bridges["Redes"].map(", ".join)),
+                         hide_index=True, use_container_width=True)
+
+        st.markdown("**Camino más corto entre actores**")
+        col1, col2 = st.columns(2)
+        origin = col1.selectbox("Desde", actors, key="path_origin")
+        target = col2.selectbox("Hasta", actors, index=min(1, len(actors) - 1), key="path_target")
+        path = combined.shortest_path(origin, target)
+        if path:
+            st.write(" → ".join(path) + f" ({len(path) - 1} saltos)")
+        else:
+            st.write("No hay un camino que conecte a estos actores.")
+
+        st.markdown("**Vecindario de un actor**")
+        col1, col2 = st.columns([3, 1])
+        actor = col1.selectbox("Actor", actors, key="hop_actor")
+        k = col2.number_input("Saltos", min_value=1, max_value=6, value=2, key="hop_k")
+        neighborhood = combined.neighborhood(actor, int(k))
+        st.dataframe(neighborhood.assign(Redes=neighborhood["Redes"].map(", ".join)),
+                     hide_index=True, use_container_width=True)
+
+
+def render():
+    st.header("Análisis de Red por Cultivos", divider='blue')
+    network_panel()
+    show_cross_crop_queries()
+
+
+# Pestañas, tipo de visualización y clics en la red solo vuelven a ejecutar este fragmento
+@profiling.fragment("Análisis de red por cultivos")
+def network_panel():
+    # Pestañas para alternar entre las redes
+    TS = ui.tabs(options=list(NETWORKS), 
+                   default_value='Banano/ASBAMA', key="network_tabs")
+    
+    # Selector para elegir el tipo de visualización
+    viz_type = st.selectbox("Elige el tipo de visualización", 
+                            ["Estática (Matplotlib)", "Interactiva (PyVis)"],
+                            index=1, key="network_viz")  # Por defecto la interactiva
+    
+    # Mostrar según la pestaña seleccionada y el tipo de visualización
+    spec = NETWORKS[TS]
+    if viz_type == "Estática (Matplotlib)":
+        draw_network_static(spec.key, spec.static_title)
+    else:
+        draw_network_interactive(spec.key, spec.interactive_title)
+    show_interpretation(spec.key, spec.label)
@@ -0,0 +1,105 @@
+/* Interacción del sitio estático (python -m cas.export): pestañas, filtros del
+   inventario, escenarios de capacidad y carrusel del brief, todo en el navegador. */
+(function () {
+  "use strict";
+
+  // Pestañas: cada botón [data-tab] muestra el panel con ese id dentro de su grupo
+  document.querySelectorAll(".tabs[data-group]").forEach(function (bar) {
+    var buttons = bar.querySelectorAll("button[data-tab]");
+    function show(id) {
+      buttons.forEach(function (b) { b.classList.toggle("active", b.dataset.tab === id); });
+      document.querySelectorAll('.tab-panel[data-group="' + bar.dataset.group + '"]').forEach(function (p) {
+        p.hidden = p.id !== id;
+      });
+    }
+    buttons.forEach(function (b) { b.addEventListener("click", function () { show(b.dataset.tab); }); });
+    show(bar.dataset.active || buttons[0].dataset.tab);
+  });
+
+  // Escenarios de capacidad: el selector muestra el bloque del escenario elegido
+  document.querySelectorAll("select[data-scenarios]").forEach(function (select) {
+    var blocks = document.querySelectorAll('[data-scenario-of="' + select.dataset.scenarios + '"]');
+    function show() {
+      blocks.forEach(function (b) { b.hidden = b.dataset.scenario !== select.value; });
+    }
+    select.addEventListener("change", show);
+    show();
+  });
+
+  // Carrusel del brief: botones anterior/siguiente arriba y abajo de cada pestaña
+  document.querySelectorAll(".carousel").forEach(function (carousel) {
+    var pages = JSON.parse(carousel.dataset.pages);
+    var img = carousel.querySelector("img");
+    var caption = carousel.querySelector("figcaption");
+    var index = 0;
+    function show() {
+      img.src = pages[index];
+      caption.textContent = carousel.dataset.title + " (" + (index + 1) + " / " + pages.length + ")";
+    }
+    carousel.querySelectorAll("button[data-step]").forEach(function (b) {
+      b.addEventListener("click", function () {
+        index = Math.min(Math.max(index + Number(b.dataset.step), 0), pages.length - 1);
+        show();
+      });
+    });
+    show();
+  });
+
+  // Inventario: filtros en cascada sobre el índice exportado y páginas de tarjetas
+  var inventory = document.getElementById("inventory");
+  if (inventory && window.CAS_INVENTORY) {
+    var data = window.CAS_INVENTORY;
+    var componente = document.getElementById("f-componente");
+    var resultado = document.getElementById("f-resultado");
+    var cultivo = document.getElementById("f-cultivo");
+    var title = document.getElementById("inventory-title");
+    var cards = document.getElementById("inventory-cards");
+    var caption = document.getElementById("inventory-caption");
+    var more = document.getElementById("inventory-more");
+    var rows = [];
+    var shown = 0;
+
+    function fill(select, options, selected) {
+      select.innerHTML = "";
+      options.forEach(function (option) {
+        var el = document.createElement("option");
+        el.value = el.textContent = option;
+        select.appendChild(el);
+      });
+      select.value = options.indexOf(selected) >= 0 ? selected : options[0];
+    }
+    function sorted(object) { return Object.keys(object).sort(); }
+    function capitalize(text) { return text.charAt(0).toUpperCase() + text.slice(1); }
+
+    function showPage() {
+      var next = rows.slice(shown, shown + data.pageSize);
+      cards.insertAdjacentHTML("beforeend", next.map(function (row) { return data.cards[row]; }).join("\n"));
+      shown += next.length;
+      caption.textContent = "Mostrando " + shown + " de " + rows.length + " productos";
+      more.hidden = shown >= rows.length;
+    }
+    function update() {
+      rows = data.index[componente.value][resultado.value][cultivo.value] || [];
+      title.textContent = "Productos por sistema productivo: " +
+        (cultivo.value !== data.allCrops ? capitalize(cultivo.value) : "Todos");
+      cards.innerHTML = rows.length ? "" : "<p>No hay inventario para los filtros seleccionados.</p>";
+      shown = 0;
+      if (rows.length) { showPage(); } else { caption.textContent = ""; more.hidden = true; }
+    }
+    function onComponente() {
+      fill(resultado, sorted(data.index[componente.value]));
+      onResultado();
+    }
+    function onResultado() {
+      fill(cultivo, sorted(data.index[componente.value][resultado.value]), data.allCrops);
+      update();
+    }
+
+    fill(componente, sorted(data.index));
+    componente.addEventListener("change", onComponente);
+    resultado.addEventListener("change", onResultado);
+    cultivo.addEventListener("change", update);
+    more.addEventListener("click", showPage);
+    onComponente();
+  }
+})();
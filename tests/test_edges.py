@@ -0,0 +1,73 @@
+"""La ingesta por bloques (``stream_edges``) y la agregación en memoria
+(``collapse_edges``) dan el mismo grafo para cada regla de aristas repetidas."""
+import numpy as np
+import pytest
+
+from cas.data import load_network_edges
+from cas.edges import AGGREGATIONS, collapse_edges, stream_edges
+from cas.graphs import CompactGraph
+from cas.networks import NETWORKS
+
+# Pares repetidos en bloques distintos, pesos y tipos vacíos
+REPEATED = """Origen;Destino;Tipo de Interacción;Periodicidad de la Interacción
+A;B;x;1
+B;C;y;2
+A;B;z;
+C;A;;3
+A;B;x;4
+B;C;;
+D;A;y;2
+"""
+
+
+def assert_same_graph(expected, actual):
+    np.testing.assert_array_equal(actual.names, expected.names)
+    np.testing.assert_array_equal(actual.src, expected.src)
+    np.testing.assert_array_equal(actual.dst, expected.dst)
+    np.testing.assert_array_equal(actual.labels, expected.labels)
+    # El flujo guarda los pesos en float32
+    np.testing.assert_allclose(actual.weight.astype(float), expected.weight.astype(float), rtol=1e-6)
+
+
+def check_paths(path, how, chunksize):
+    in_memory = CompactGraph.from_frame(collapse_edges(load_network_edges(path), how))
+    table = stream_edges(path, how, chunksize=chunksize)
+    assert_same_graph(in_memory, CompactGraph.from_frame(table.to_frame()))
+    assert_same_graph(in_memory, CompactGraph.from_edge_table(table))
+
+
+@pytest.mark.parametrize("how", AGGREGATIONS)
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 100])
+def test_repeated_edges(tmp_path, how, chunksize):
+    path = tmp_path / "red.csv"
+    path.write_text(REPEATED, encoding="utf-8")
+    check_paths(str(path), how, chunksize)
+
+
+def test_repeated_edge_rules(tmp_path):
+    path = tmp_path / "red.csv"
+    path.write_text(REPEATED, encoding="utf-8")
+    df = load_network_edges(str(path))
+    ab = {how: collapse_edges(df, how).iloc[0] for how in AGGREGATIONS}
+    assert (ab["last"]["Tipo de Interacción"], ab["last"]["Peso"]) == ("x", 4)
+    assert (ab["sum"]["Tipo de Interacción"], ab["sum"]["Peso"]) == ("x / z", 5)
+    assert ab["mean"]["Peso"] == 2.5
+    # "last" conserva la última fila aunque su peso esté vacío
+    assert np.isnan(collapse_edges(df, "last").iloc[1]["Peso"])
+
+
+@pytest.mark.parametrize("how", AGGREGATIONS)
+@pytest.mark.parametrize("key", list(NETWORKS))
+def test_bundled_networks(key, how):
+    check_paths(NETWORKS[key].edges, how, chunksize=7)
+
+
+def test_last_matches_raw_rows():
+    # La regla por defecto da el mismo grafo que las filas sin agregar
+    path = NETWORKS["Café"].edges
+    raw = load_network_edges(path)
+    collapsed = collapse_edges(raw, "last")
+    assert len(collapsed) < len(raw)
+    expected, actual = CompactGraph.from_frame(raw), CompactGraph.from_frame(collapsed)
+    assert_same_graph(expected, actual)
+    assert actual.weight.dtype == expected.weight.dtype
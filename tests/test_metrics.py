@@ -0,0 +1,48 @@
+"""Las centralidades vectorizadas de ``cas.metrics`` coinciden con networkx."""
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from cas.graphs import CompactGraph, get_compact
+from cas.metrics import centralities
+from cas.networks import NETWORKS
+
+REFERENCES = {
+    "degree": nx.degree_centrality,
+    "betweenness": nx.betweenness_centrality,
+    "closeness": nx.closeness_centrality,
+    "eigenvector": lambda G: nx.eigenvector_centrality(G, max_iter=1000),
+}
+
+
+def random_graph(seed, n_nodes=30, n_edges=60):
+    # Dirigida, con aristas repetidas, lazos y nodos fuera de la componente principal
+    rng = np.random.default_rng(seed)
+    names = [f"Productores {i}" for i in range(n_nodes)]
+    return CompactGraph.from_frame(pd.DataFrame({
+        "Origen": rng.choice(names, n_edges),
+        "Destino": rng.choice(names, n_edges),
+        "Tipo de Interacción": "Visitas",
+        "Peso": rng.integers(1, 5, n_edges),
+    }))
+
+
+def assert_matches_networkx(graph):
+    G = graph.to_networkx()
+    table = centralities(graph)
+    assert list(table.index) == list(G.nodes())
+    for column, reference in REFERENCES.items():
+        expected = pd.Series(reference(G)).reindex(table.index)
+        np.testing.assert_allclose(table[column], expected, rtol=0, atol=1e-12, err_msg=column)
+    np.testing.assert_array_equal(table["connections"], [G.degree(node) for node in table.index])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_graphs(seed):
+    assert_matches_networkx(random_graph(seed))
+
+
+@pytest.mark.parametrize("key", list(NETWORKS))
+def test_bundled_networks(key):
+    assert_matches_networkx(get_compact(key))